@@ -1,11 +1,15 @@
 __version__ = "0.0.2"
 
-from .sim.stabilizer import StabilizerSimulator
+from .sim.stabilizer import StabilizerSimulator, PackedStabilizerSimulator, BatchedStabilizerSimulator
 from .sim.statevector import StatevectorSimulator
+from .sim.numpy_statevector import NumpyStatevectorSimulator, BatchedNumpyStatevectorSimulator
+from .sim.frame import PauliFrameSimulator
+from .sim.auto import AutoSimulator
 
 from .circuit import Circuit
 from .protocol import Protocol
 from .sampler.direct import DirectSampler
 from .sampler.subset import SubsetSampler
+from .sampler.memo import OutcomeCache, SubsetProbCache
 
 from .noise import *
\ No newline at end of file
@@ -102,12 +102,18 @@ d = { 'settings': { 'branch': 'master',
                                  'qsample.circuit.Circuit.__len__': ('circuit.html#circuit.__len__', 'qsample/circuit.py'),
                                  'qsample.circuit.Circuit.__setitem__': ('circuit.html#circuit.__setitem__', 'qsample/circuit.py'),
                                  'qsample.circuit.Circuit.__str__': ('circuit.html#circuit.__str__', 'qsample/circuit.py'),
+                                 'qsample.circuit.Circuit.clifford': ('circuit.html#circuit.clifford', 'qsample/circuit.py'),
+                                 'qsample.circuit.Circuit.digest': ('circuit.html#circuit.digest', 'qsample/circuit.py'),
                                  'qsample.circuit.Circuit.draw': ('circuit.html#circuit.draw', 'qsample/circuit.py'),
                                  'qsample.circuit.Circuit.id': ('circuit.html#circuit.id', 'qsample/circuit.py'),
                                  'qsample.circuit.Circuit.insert': ('circuit.html#circuit.insert', 'qsample/circuit.py'),
                                  'qsample.circuit.Circuit.n_qubits': ('circuit.html#circuit.n_qubits', 'qsample/circuit.py'),
                                  'qsample.circuit.Circuit.n_ticks': ('circuit.html#circuit.n_ticks', 'qsample/circuit.py'),
+                                 'qsample.circuit.Circuit.program': ('circuit.html#circuit.program', 'qsample/circuit.py'),
                                  'qsample.circuit.Circuit.qubits': ('circuit.html#circuit.qubits', 'qsample/circuit.py'),
+                                 'qsample.circuit.Circuit.relabel': ('circuit.html#circuit.relabel', 'qsample/circuit.py'),
+                                 'qsample.circuit.Circuit.terminal_measurements': ( 'circuit.html#circuit.terminal_measurements',
+                                                                                    'qsample/circuit.py'),
                                  'qsample.circuit.draw_circuit': ('circuit.html#draw_circuit', 'qsample/circuit.py'),
                                  'qsample.circuit.unpack': ('circuit.html#unpack', 'qsample/circuit.py')},
             'qsample.examples': { 'qsample.examples.flagged': ('examples.html#flagged', 'qsample/examples.py'),
@@ -125,41 +131,50 @@ d = { 'settings': { 'branch': 'master',
                               'qsample.math.binom': ('math.html#binom', 'qsample/math.py'),
                               'qsample.math.cartesian_product': ('math.html#cartesian_product', 'qsample/math.py'),
                               'qsample.math.comb': ('math.html#comb', 'qsample/math.py'),
+                              'qsample.math.iter_subset_probs': ('math.html#iter_subset_probs', 'qsample/math.py'),
                               'qsample.math.joint_binom': ('math.html#joint_binom', 'qsample/math.py'),
+                              'qsample.math.log_binom': ('math.html#log_binom', 'qsample/math.py'),
+                              'qsample.math.log_comb': ('math.html#log_comb', 'qsample/math.py'),
                               'qsample.math.subset_cards': ('math.html#subset_cards', 'qsample/math.py'),
+                              'qsample.math.subset_prob_table': ('math.html#subset_prob_table', 'qsample/math.py'),
                               'qsample.math.subset_probs': ('math.html#subset_probs', 'qsample/math.py')},
             'qsample.noise': { 'qsample.noise.E0': ('noise.html#e0', 'qsample/noise.py'),
+                               'qsample.noise.E0.faults': ('noise.html#e0.faults', 'qsample/noise.py'),
                                'qsample.noise.E0.group': ('noise.html#e0.group', 'qsample/noise.py'),
                                'qsample.noise.E0.run': ('noise.html#e0.run', 'qsample/noise.py'),
                                'qsample.noise.E1': ('noise.html#e1', 'qsample/noise.py'),
-                               'qsample.noise.E1.generate': ('noise.html#e1.generate', 'qsample/noise.py'),
+                               'qsample.noise.E1.errset': ('noise.html#e1.errset', 'qsample/noise.py'),
                                'qsample.noise.E1.group': ('noise.html#e1.group', 'qsample/noise.py'),
                                'qsample.noise.E1_1': ('noise.html#e1_1', 'qsample/noise.py'),
-                               'qsample.noise.E1_1.generate': ('noise.html#e1_1.generate', 'qsample/noise.py'),
+                               'qsample.noise.E1_1.errset': ('noise.html#e1_1.errset', 'qsample/noise.py'),
                                'qsample.noise.E1_1.group': ('noise.html#e1_1.group', 'qsample/noise.py'),
                                'qsample.noise.E2': ('noise.html#e2', 'qsample/noise.py'),
-                               'qsample.noise.E2.generate': ('noise.html#e2.generate', 'qsample/noise.py'),
+                               'qsample.noise.E2.errset': ('noise.html#e2.errset', 'qsample/noise.py'),
                                'qsample.noise.E2.group': ('noise.html#e2.group', 'qsample/noise.py'),
                                'qsample.noise.E3': ('noise.html#e3', 'qsample/noise.py'),
-                               'qsample.noise.E3.generate': ('noise.html#e3.generate', 'qsample/noise.py'),
                                'qsample.noise.E3.group': ('noise.html#e3.group', 'qsample/noise.py'),
                                'qsample.noise.E3_1': ('noise.html#e3_1', 'qsample/noise.py'),
-                               'qsample.noise.E3_1.generate': ('noise.html#e3_1.generate', 'qsample/noise.py'),
                                'qsample.noise.E3_1.group': ('noise.html#e3_1.group', 'qsample/noise.py'),
                                'qsample.noise.ErrorModel': ('noise.html#errormodel', 'qsample/noise.py'),
+                               'qsample.noise.ErrorModel._fault_list': ('noise.html#errormodel._fault_list', 'qsample/noise.py'),
+                               'qsample.noise.ErrorModel._sample': ('noise.html#errormodel._sample', 'qsample/noise.py'),
+                               'qsample.noise.ErrorModel._table': ('noise.html#errormodel._table', 'qsample/noise.py'),
                                'qsample.noise.ErrorModel.choose_p': ('noise.html#errormodel.choose_p', 'qsample/noise.py'),
                                'qsample.noise.ErrorModel.choose_w': ('noise.html#errormodel.choose_w', 'qsample/noise.py'),
+                               'qsample.noise.ErrorModel.enumerate_w': ('noise.html#errormodel.enumerate_w', 'qsample/noise.py'),
+                               'qsample.noise.ErrorModel.errset': ('noise.html#errormodel.errset', 'qsample/noise.py'),
+                               'qsample.noise.ErrorModel.faults': ('noise.html#errormodel.faults', 'qsample/noise.py'),
                                'qsample.noise.ErrorModel.generate': ('noise.html#errormodel.generate', 'qsample/noise.py'),
                                'qsample.noise.ErrorModel.group': ('noise.html#errormodel.group', 'qsample/noise.py'),
+                               'qsample.noise.ErrorModel.partition': ('noise.html#errormodel.partition', 'qsample/noise.py'),
                                'qsample.noise.ErrorModel.run': ('noise.html#errormodel.run', 'qsample/noise.py'),
                                'qsample.noise.S1': ('noise.html#s1', 'qsample/noise.py'),
-                               'qsample.noise.S1.generate': ('noise.html#s1.generate', 'qsample/noise.py'),
+                               'qsample.noise.S1.errset': ('noise.html#s1.errset', 'qsample/noise.py'),
                                'qsample.noise.S1.group': ('noise.html#s1.group', 'qsample/noise.py'),
                                'qsample.noise.S2': ('noise.html#s2', 'qsample/noise.py'),
-                               'qsample.noise.S2.generate': ('noise.html#s2.generate', 'qsample/noise.py'),
+                               'qsample.noise.S2.errset': ('noise.html#s2.errset', 'qsample/noise.py'),
                                'qsample.noise.S2.group': ('noise.html#s2.group', 'qsample/noise.py'),
                                'qsample.noise.S4': ('noise.html#s4', 'qsample/noise.py'),
-                               'qsample.noise.S4.generate': ('noise.html#s4.generate', 'qsample/noise.py'),
                                'qsample.noise.S4.group': ('noise.html#s4.group', 'qsample/noise.py')},
             'qsample.protocol': { 'qsample.protocol.Protocol': ('protocol.html#protocol', 'qsample/protocol.py'),
                                   'qsample.protocol.Protocol.__init__': ('protocol.html#protocol.__init__', 'qsample/protocol.py'),
@@ -168,10 +183,17 @@ d = { 'settings': { 'branch': 'master',
                                                                                 'qsample/protocol.py'),
                                   'qsample.protocol.Protocol.draw': ('protocol.html#protocol.draw', 'qsample/protocol.py'),
                                   'qsample.protocol.Protocol.get_circuit': ('protocol.html#protocol.get_circuit', 'qsample/protocol.py'),
+                                  'qsample.protocol.Protocol.qubit_map': ('protocol.html#protocol.qubit_map', 'qsample/protocol.py'),
                                   'qsample.protocol.Protocol.qubits': ('protocol.html#protocol.qubits', 'qsample/protocol.py'),
                                   'qsample.protocol.Protocol.root': ('protocol.html#protocol.root', 'qsample/protocol.py'),
                                   'qsample.protocol.Protocol.successor': ('protocol.html#protocol.successor', 'qsample/protocol.py'),
-                                  'qsample.protocol.draw_protocol': ('protocol.html#draw_protocol', 'qsample/protocol.py')},
+                                  'qsample.protocol.QubitMap': ('protocol.html#qubitmap', 'qsample/protocol.py'),
+                                  'qsample.protocol.QubitMap.__init__': ('protocol.html#qubitmap.__init__', 'qsample/protocol.py'),
+                                  'qsample.protocol.QubitMap.circuit': ('protocol.html#qubitmap.circuit', 'qsample/protocol.py'),
+                                  'qsample.protocol.QubitMap.faults': ('protocol.html#qubitmap.faults', 'qsample/protocol.py'),
+                                  'qsample.protocol.QubitMap.run': ('protocol.html#qubitmap.run', 'qsample/protocol.py'),
+                                  'qsample.protocol.draw_protocol': ('protocol.html#draw_protocol', 'qsample/protocol.py'),
+                                  'qsample.protocol.live_ranges': ('protocol.html#live_ranges', 'qsample/protocol.py')},
             'qsample.sampler.direct': { 'qsample.sampler.direct.DirectSampler': ( 'sampler.direct.html#directsampler',
                                                                                   'qsample/sampler/direct.py'),
                                         'qsample.sampler.direct.DirectSampler.__err_params_to_matrix': ( 'sampler.direct.html#directsampler.__err_params_to_matrix',
@@ -192,12 +214,43 @@ d = { 'settings': { 'branch': 'master',
                                                                                                                 'qsample/sampler/experimental.py'),
                                               'qsample.sampler.experimental.SubsetSamplerERU.wplus1': ( 'sampler.experimental.html#subsetsamplereru.wplus1',
                                                                                                         'qsample/sampler/experimental.py')},
+            'qsample.sampler.memo': { 'qsample.sampler.memo.OutcomeCache': ('sampler.memo.html#outcomecache', 'qsample/sampler/memo.py'),
+                                      'qsample.sampler.memo.OutcomeCache.__init__': ( 'sampler.memo.html#outcomecache.__init__',
+                                                                                      'qsample/sampler/memo.py'),
+                                      'qsample.sampler.memo.OutcomeCache.__len__': ( 'sampler.memo.html#outcomecache.__len__',
+                                                                                     'qsample/sampler/memo.py'),
+                                      'qsample.sampler.memo.OutcomeCache.clear': ( 'sampler.memo.html#outcomecache.clear',
+                                                                                   'qsample/sampler/memo.py'),
+                                      'qsample.sampler.memo.OutcomeCache.key': ( 'sampler.memo.html#outcomecache.key',
+                                                                                 'qsample/sampler/memo.py'),
+                                      'qsample.sampler.memo.OutcomeCache.run': ( 'sampler.memo.html#outcomecache.run',
+                                                                                 'qsample/sampler/memo.py'),
+                                      'qsample.sampler.memo.SubsetProbCache': ( 'sampler.memo.html#subsetprobcache',
+                                                                                'qsample/sampler/memo.py'),
+                                      'qsample.sampler.memo.SubsetProbCache.__init__': ( 'sampler.memo.html#subsetprobcache.__init__',
+                                                                                         'qsample/sampler/memo.py'),
+                                      'qsample.sampler.memo.SubsetProbCache.__len__': ( 'sampler.memo.html#subsetprobcache.__len__',
+                                                                                        'qsample/sampler/memo.py'),
+                                      'qsample.sampler.memo.SubsetProbCache.clear': ( 'sampler.memo.html#subsetprobcache.clear',
+                                                                                      'qsample/sampler/memo.py'),
+                                      'qsample.sampler.memo.SubsetProbCache.flush': ( 'sampler.memo.html#subsetprobcache.flush',
+                                                                                      'qsample/sampler/memo.py'),
+                                      'qsample.sampler.memo.SubsetProbCache.key': ( 'sampler.memo.html#subsetprobcache.key',
+                                                                                    'qsample/sampler/memo.py'),
+                                      'qsample.sampler.memo.SubsetProbCache.save': ( 'sampler.memo.html#subsetprobcache.save',
+                                                                                     'qsample/sampler/memo.py'),
+                                      'qsample.sampler.memo.SubsetProbCache.subset_probs': ( 'sampler.memo.html#subsetprobcache.subset_probs',
+                                                                                             'qsample/sampler/memo.py')},
             'qsample.sampler.subset': { 'qsample.sampler.subset.SubsetSampler': ( 'sampler.subset.html#subsetsampler',
                                                                                   'qsample/sampler/subset.py'),
                                         'qsample.sampler.subset.SubsetSampler.__init__': ( 'sampler.subset.html#subsetsampler.__init__',
                                                                                            'qsample/sampler/subset.py'),
                                         'qsample.sampler.subset.SubsetSampler._choose_subset': ( 'sampler.subset.html#subsetsampler._choose_subset',
                                                                                                  'qsample/sampler/subset.py'),
+                                        'qsample.sampler.subset.SubsetSampler._enumerate': ( 'sampler.subset.html#subsetsampler._enumerate',
+                                                                                             'qsample/sampler/subset.py'),
+                                        'qsample.sampler.subset.SubsetSampler._enumerate_subset': ( 'sampler.subset.html#subsetsampler._enumerate_subset',
+                                                                                                    'qsample/sampler/subset.py'),
                                         'qsample.sampler.subset.SubsetSampler.err_params_to_matrix': ( 'sampler.subset.html#subsetsampler.err_params_to_matrix',
                                                                                                        'qsample/sampler/subset.py'),
                                         'qsample.sampler.subset.SubsetSampler.run': ( 'sampler.subset.html#subsetsampler.run',
@@ -241,17 +294,208 @@ d = { 'settings': { 'branch': 'master',
                                       'qsample.sampler.tree.Variable.rate': ('sampler.tree.html#variable.rate', 'qsample/sampler/tree.py'),
                                       'qsample.sampler.tree.Variable.var': ('sampler.tree.html#variable.var', 'qsample/sampler/tree.py'),
                                       'qsample.sampler.tree.draw_tree': ('sampler.tree.html#draw_tree', 'qsample/sampler/tree.py')},
-            'qsample.sim.mixin': { 'qsample.sim.mixin.CircuitRunnerMixin': ('sim.mixin.html#circuitrunnermixin', 'qsample/sim/mixin.py'),
+            'qsample.sim.auto': { 'qsample.sim.auto.AutoSimulator': ('sim.auto.html#autosimulator', 'qsample/sim/auto.py'),
+                                  'qsample.sim.auto.AutoSimulator.__getattr__': ( 'sim.auto.html#autosimulator.__getattr__',
+                                                                                  'qsample/sim/auto.py'),
+                                  'qsample.sim.auto.AutoSimulator.__init__': ( 'sim.auto.html#autosimulator.__init__',
+                                                                               'qsample/sim/auto.py'),
+                                  'qsample.sim.auto.AutoSimulator._dispatch': ( 'sim.auto.html#autosimulator._dispatch',
+                                                                                'qsample/sim/auto.py'),
+                                  'qsample.sim.auto.AutoSimulator.reset': ('sim.auto.html#autosimulator.reset', 'qsample/sim/auto.py'),
+                                  'qsample.sim.auto.AutoSimulator.restore': ('sim.auto.html#autosimulator.restore', 'qsample/sim/auto.py'),
+                                  'qsample.sim.auto.AutoSimulator.run': ('sim.auto.html#autosimulator.run', 'qsample/sim/auto.py'),
+                                  'qsample.sim.auto.AutoSimulator.run_checkpointed': ( 'sim.auto.html#autosimulator.run_checkpointed',
+                                                                                       'qsample/sim/auto.py'),
+                                  'qsample.sim.auto.AutoSimulator.snapshot': ( 'sim.auto.html#autosimulator.snapshot',
+                                                                               'qsample/sim/auto.py'),
+                                  'qsample.sim.auto.AutoSimulator.to_statevector': ( 'sim.auto.html#autosimulator.to_statevector',
+                                                                                     'qsample/sim/auto.py')},
+            'qsample.sim.frame': { 'qsample.sim.frame.PauliFrameSimulator': ('sim.frame.html#pauliframesimulator', 'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.CNOT': ( 'sim.frame.html#pauliframesimulator.cnot',
+                                                                                   'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.H': ( 'sim.frame.html#pauliframesimulator.h',
+                                                                                'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.I': ( 'sim.frame.html#pauliframesimulator.i',
+                                                                                'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.MSd': ( 'sim.frame.html#pauliframesimulator.msd',
+                                                                                  'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.Q': ( 'sim.frame.html#pauliframesimulator.q',
+                                                                                'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.Qd': ( 'sim.frame.html#pauliframesimulator.qd',
+                                                                                 'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.R': ( 'sim.frame.html#pauliframesimulator.r',
+                                                                                'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.Rd': ( 'sim.frame.html#pauliframesimulator.rd',
+                                                                                 'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.S': ( 'sim.frame.html#pauliframesimulator.s',
+                                                                                'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.Sd': ( 'sim.frame.html#pauliframesimulator.sd',
+                                                                                 'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.X': ( 'sim.frame.html#pauliframesimulator.x',
+                                                                                'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.Y': ( 'sim.frame.html#pauliframesimulator.y',
+                                                                                'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.Z': ( 'sim.frame.html#pauliframesimulator.z',
+                                                                                'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.__init__': ( 'sim.frame.html#pauliframesimulator.__init__',
+                                                                                       'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator._apply_fault': ( 'sim.frame.html#pauliframesimulator._apply_fault',
+                                                                                           'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator._reference': ( 'sim.frame.html#pauliframesimulator._reference',
+                                                                                         'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.init': ( 'sim.frame.html#pauliframesimulator.init',
+                                                                                   'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.measure': ( 'sim.frame.html#pauliframesimulator.measure',
+                                                                                      'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.reset': ( 'sim.frame.html#pauliframesimulator.reset',
+                                                                                    'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.run': ( 'sim.frame.html#pauliframesimulator.run',
+                                                                                  'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.PauliFrameSimulator.run_checkpointed': ( 'sim.frame.html#pauliframesimulator.run_checkpointed',
+                                                                                               'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.ReferenceSimulator': ('sim.frame.html#referencesimulator', 'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.ReferenceSimulator.measure': ( 'sim.frame.html#referencesimulator.measure',
+                                                                                     'qsample/sim/frame.py'),
+                                   'qsample.sim.frame.ReferenceSimulator.run': ( 'sim.frame.html#referencesimulator.run',
+                                                                                 'qsample/sim/frame.py')},
+            'qsample.sim.mixin': { 'qsample.sim.mixin.BatchedRunnerMixin': ('sim.mixin.html#batchedrunnermixin', 'qsample/sim/mixin.py'),
+                                   'qsample.sim.mixin.BatchedRunnerMixin.run': ( 'sim.mixin.html#batchedrunnermixin.run',
+                                                                                 'qsample/sim/mixin.py'),
+                                   'qsample.sim.mixin.CircuitRunnerMixin': ('sim.mixin.html#circuitrunnermixin', 'qsample/sim/mixin.py'),
+                                   'qsample.sim.mixin.CircuitRunnerMixin._apply_fault': ( 'sim.mixin.html#circuitrunnermixin._apply_fault',
+                                                                                          'qsample/sim/mixin.py'),
                                    'qsample.sim.mixin.CircuitRunnerMixin._apply_gate': ( 'sim.mixin.html#circuitrunnermixin._apply_gate',
                                                                                          'qsample/sim/mixin.py'),
+                                   'qsample.sim.mixin.CircuitRunnerMixin._deferred': ( 'sim.mixin.html#circuitrunnermixin._deferred',
+                                                                                       'qsample/sim/mixin.py'),
+                                   'qsample.sim.mixin.CircuitRunnerMixin._fault_ticks': ( 'sim.mixin.html#circuitrunnermixin._fault_ticks',
+                                                                                          'qsample/sim/mixin.py'),
+                                   'qsample.sim.mixin.CircuitRunnerMixin.measure_joint': ( 'sim.mixin.html#circuitrunnermixin.measure_joint',
+                                                                                           'qsample/sim/mixin.py'),
+                                   'qsample.sim.mixin.CircuitRunnerMixin.reset': ( 'sim.mixin.html#circuitrunnermixin.reset',
+                                                                                   'qsample/sim/mixin.py'),
+                                   'qsample.sim.mixin.CircuitRunnerMixin.restore': ( 'sim.mixin.html#circuitrunnermixin.restore',
+                                                                                     'qsample/sim/mixin.py'),
                                    'qsample.sim.mixin.CircuitRunnerMixin.run': ( 'sim.mixin.html#circuitrunnermixin.run',
-                                                                                 'qsample/sim/mixin.py')},
-            'qsample.sim.stabilizer': { 'qsample.sim.stabilizer.ChpSimulator': ( 'sim.stabilizer.html#chpsimulator',
+                                                                                 'qsample/sim/mixin.py'),
+                                   'qsample.sim.mixin.CircuitRunnerMixin.run_branches': ( 'sim.mixin.html#circuitrunnermixin.run_branches',
+                                                                                          'qsample/sim/mixin.py'),
+                                   'qsample.sim.mixin.CircuitRunnerMixin.run_checkpointed': ( 'sim.mixin.html#circuitrunnermixin.run_checkpointed',
+                                                                                              'qsample/sim/mixin.py'),
+                                   'qsample.sim.mixin.CircuitRunnerMixin.snapshot': ( 'sim.mixin.html#circuitrunnermixin.snapshot',
+                                                                                      'qsample/sim/mixin.py'),
+                                   'qsample.sim.mixin.CircuitRunnerMixin.state_key': ( 'sim.mixin.html#circuitrunnermixin.state_key',
+                                                                                       'qsample/sim/mixin.py')},
+            'qsample.sim.numpy_statevector': { 'qsample.sim.numpy_statevector.BatchedNumpyStatevectorSimulator': ( 'sim.numpy_statevector.html#batchednumpystatevectorsimulator',
+                                                                                                                   'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.BatchedNumpyStatevectorSimulator.__init__': ( 'sim.numpy_statevector.html#batchednumpystatevectorsimulator.__init__',
+                                                                                                                            'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.BatchedNumpyStatevectorSimulator.init': ( 'sim.numpy_statevector.html#batchednumpystatevectorsimulator.init',
+                                                                                                                        'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.BatchedNumpyStatevectorSimulator.measure': ( 'sim.numpy_statevector.html#batchednumpystatevectorsimulator.measure',
+                                                                                                                           'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.BatchedNumpyStatevectorSimulator.pauli': ( 'sim.numpy_statevector.html#batchednumpystatevectorsimulator.pauli',
+                                                                                                                         'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator': ( 'sim.numpy_statevector.html#numpystatevectorsimulator',
+                                                                                                            'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.CNOT': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.cnot',
+                                                                                                                 'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.H': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.h',
+                                                                                                              'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.I': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.i',
+                                                                                                              'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.MSd': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.msd',
+                                                                                                                'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.Q': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.q',
+                                                                                                              'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.Qd': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.qd',
+                                                                                                               'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.R': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.r',
+                                                                                                              'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.Rd': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.rd',
+                                                                                                               'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.Rx': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.rx',
+                                                                                                               'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.Ry': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.ry',
+                                                                                                               'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.Rz': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.rz',
+                                                                                                               'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.S': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.s',
+                                                                                                              'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.Sd': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.sd',
+                                                                                                               'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.T': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.t',
+                                                                                                              'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.Td': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.td',
+                                                                                                               'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.X': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.x',
+                                                                                                              'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.Y': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.y',
+                                                                                                              'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.Z': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.z',
+                                                                                                              'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.__init__': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.__init__',
+                                                                                                                     'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator._apply1': ( 'sim.numpy_statevector.html#numpystatevectorsimulator._apply1',
+                                                                                                                    'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator._apply2': ( 'sim.numpy_statevector.html#numpystatevectorsimulator._apply2',
+                                                                                                                    'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator._fused': ( 'sim.numpy_statevector.html#numpystatevectorsimulator._fused',
+                                                                                                                   'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator._probability': ( 'sim.numpy_statevector.html#numpystatevectorsimulator._probability',
+                                                                                                                         'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator._slice': ( 'sim.numpy_statevector.html#numpystatevectorsimulator._slice',
+                                                                                                                   'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.expectation': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.expectation',
+                                                                                                                        'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.init': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.init',
+                                                                                                                 'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.measure': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.measure',
+                                                                                                                    'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.measure_joint': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.measure_joint',
+                                                                                                                          'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.paulis': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.paulis',
+                                                                                                                   'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.reset': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.reset',
+                                                                                                                  'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.restore': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.restore',
+                                                                                                                    'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.run': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.run',
+                                                                                                                'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.NumpyStatevectorSimulator.snapshot': ( 'sim.numpy_statevector.html#numpystatevectorsimulator.snapshot',
+                                                                                                                     'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.fuse_gates': ( 'sim.numpy_statevector.html#fuse_gates',
+                                                                                             'qsample/sim/numpy_statevector.py'),
+                                               'qsample.sim.numpy_statevector.gate_matrix': ( 'sim.numpy_statevector.html#gate_matrix',
+                                                                                              'qsample/sim/numpy_statevector.py')},
+            'qsample.sim.stabilizer': { 'qsample.sim.stabilizer.BatchedChpSimulator': ( 'sim.stabilizer.html#batchedchpsimulator',
+                                                                                        'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.BatchedChpSimulator.__init__': ( 'sim.stabilizer.html#batchedchpsimulator.__init__',
+                                                                                                 'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.BatchedChpSimulator.__str__': ( 'sim.stabilizer.html#batchedchpsimulator.__str__',
+                                                                                                'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.BatchedChpSimulator._measure_determined': ( 'sim.stabilizer.html#batchedchpsimulator._measure_determined',
+                                                                                                            'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.BatchedChpSimulator._measure_random': ( 'sim.stabilizer.html#batchedchpsimulator._measure_random',
+                                                                                                        'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.BatchedChpSimulator.measure': ( 'sim.stabilizer.html#batchedchpsimulator.measure',
+                                                                                                'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.BatchedChpSimulator.pauli': ( 'sim.stabilizer.html#batchedchpsimulator.pauli',
+                                                                                              'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.BatchedStabilizerSimulator': ( 'sim.stabilizer.html#batchedstabilizersimulator',
+                                                                                               'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.BatchedStabilizerSimulator.init': ( 'sim.stabilizer.html#batchedstabilizersimulator.init',
+                                                                                                    'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.BatchedStabilizerSimulator.measure': ( 'sim.stabilizer.html#batchedstabilizersimulator.measure',
+                                                                                                       'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.ChpSimulator': ( 'sim.stabilizer.html#chpsimulator',
                                                                                  'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.ChpSimulator.__init__': ( 'sim.stabilizer.html#chpsimulator.__init__',
                                                                                           'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.ChpSimulator.__str__': ( 'sim.stabilizer.html#chpsimulator.__str__',
                                                                                          'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.ChpSimulator._columns': ( 'sim.stabilizer.html#chpsimulator._columns',
+                                                                                          'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.ChpSimulator._measure_determined': ( 'sim.stabilizer.html#chpsimulator._measure_determined',
                                                                                                      'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.ChpSimulator._measure_random': ( 'sim.stabilizer.html#chpsimulator._measure_random',
@@ -262,6 +506,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                            'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.ChpSimulator._row_product_sign': ( 'sim.stabilizer.html#chpsimulator._row_product_sign',
                                                                                                    'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.ChpSimulator._set_columns': ( 'sim.stabilizer.html#chpsimulator._set_columns',
+                                                                                              'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.ChpSimulator.cnot': ( 'sim.stabilizer.html#chpsimulator.cnot',
                                                                                       'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.ChpSimulator.hadamard': ( 'sim.stabilizer.html#chpsimulator.hadamard',
@@ -270,6 +516,12 @@ d = { 'settings': { 'branch': 'master',
                                                                                          'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.ChpSimulator.phase': ( 'sim.stabilizer.html#chpsimulator.phase',
                                                                                        'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.ChpSimulator.reset': ( 'sim.stabilizer.html#chpsimulator.reset',
+                                                                                       'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.ChpSimulator.restore': ( 'sim.stabilizer.html#chpsimulator.restore',
+                                                                                         'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.ChpSimulator.snapshot': ( 'sim.stabilizer.html#chpsimulator.snapshot',
+                                                                                          'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.MeasureResult': ( 'sim.stabilizer.html#measureresult',
                                                                                   'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.MeasureResult.__bool__': ( 'sim.stabilizer.html#measureresult.__bool__',
@@ -282,6 +534,48 @@ d = { 'settings': { 'branch': 'master',
                                                                                            'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.MeasureResult.__str__': ( 'sim.stabilizer.html#measureresult.__str__',
                                                                                           'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator': ( 'sim.stabilizer.html#packedchpsimulator',
+                                                                                       'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator.__init__': ( 'sim.stabilizer.html#packedchpsimulator.__init__',
+                                                                                                'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator.__str__': ( 'sim.stabilizer.html#packedchpsimulator.__str__',
+                                                                                               'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator._bits': ( 'sim.stabilizer.html#packedchpsimulator._bits',
+                                                                                             'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator._columns': ( 'sim.stabilizer.html#packedchpsimulator._columns',
+                                                                                                'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator._measure_determined': ( 'sim.stabilizer.html#packedchpsimulator._measure_determined',
+                                                                                                           'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator._measure_random': ( 'sim.stabilizer.html#packedchpsimulator._measure_random',
+                                                                                                       'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator._repr_pretty_': ( 'sim.stabilizer.html#packedchpsimulator._repr_pretty_',
+                                                                                                     'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator._row_mult': ( 'sim.stabilizer.html#packedchpsimulator._row_mult',
+                                                                                                 'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator._row_product_sign': ( 'sim.stabilizer.html#packedchpsimulator._row_product_sign',
+                                                                                                         'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator._set_columns': ( 'sim.stabilizer.html#packedchpsimulator._set_columns',
+                                                                                                    'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator._word': ( 'sim.stabilizer.html#packedchpsimulator._word',
+                                                                                             'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator.cnot': ( 'sim.stabilizer.html#packedchpsimulator.cnot',
+                                                                                            'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator.hadamard': ( 'sim.stabilizer.html#packedchpsimulator.hadamard',
+                                                                                                'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator.measure': ( 'sim.stabilizer.html#packedchpsimulator.measure',
+                                                                                               'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator.phase': ( 'sim.stabilizer.html#packedchpsimulator.phase',
+                                                                                             'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator.reset': ( 'sim.stabilizer.html#packedchpsimulator.reset',
+                                                                                             'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator.restore': ( 'sim.stabilizer.html#packedchpsimulator.restore',
+                                                                                               'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedChpSimulator.snapshot': ( 'sim.stabilizer.html#packedchpsimulator.snapshot',
+                                                                                                'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedStabilizerSimulator': ( 'sim.stabilizer.html#packedstabilizersimulator',
+                                                                                              'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.PackedStabilizerSimulator.measure': ( 'sim.stabilizer.html#packedstabilizersimulator.measure',
+                                                                                                      'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.StabilizerSimulator': ( 'sim.stabilizer.html#stabilizersimulator',
                                                                                         'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.StabilizerSimulator.CNOT': ( 'sim.stabilizer.html#stabilizersimulator.cnot',
@@ -310,10 +604,19 @@ d = { 'settings': { 'branch': 'master',
                                                                                           'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.StabilizerSimulator.Z': ( 'sim.stabilizer.html#stabilizersimulator.z',
                                                                                           'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.StabilizerSimulator._measure': ( 'sim.stabilizer.html#stabilizersimulator._measure',
+                                                                                                 'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.StabilizerSimulator.init': ( 'sim.stabilizer.html#stabilizersimulator.init',
                                                                                              'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.StabilizerSimulator.measure': ( 'sim.stabilizer.html#stabilizersimulator.measure',
                                                                                                 'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.StabilizerSimulator.run_branches': ( 'sim.stabilizer.html#stabilizersimulator.run_branches',
+                                                                                                     'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer.StabilizerSimulator.state_key': ( 'sim.stabilizer.html#stabilizersimulator.state_key',
+                                                                                                  'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer._packed_product_phases': ( 'sim.stabilizer.html#_packed_product_phases',
+                                                                                           'qsample/sim/stabilizer.py'),
+                                        'qsample.sim.stabilizer._popcount': ('sim.stabilizer.html#_popcount', 'qsample/sim/stabilizer.py'),
                                         'qsample.sim.stabilizer.pauli_product_phase': ( 'sim.stabilizer.html#pauli_product_phase',
                                                                                         'qsample/sim/stabilizer.py')},
             'qsample.sim.statevector': { 'qsample.sim.statevector.MeasureResult': ( 'sim.statevector.html#measureresult',
@@ -369,6 +672,14 @@ d = { 'settings': { 'branch': 'master',
                                          'qsample.sim.statevector.StatevectorSimulator.init': ( 'sim.statevector.html#statevectorsimulator.init',
                                                                                                 'qsample/sim/statevector.py'),
                                          'qsample.sim.statevector.StatevectorSimulator.measure': ( 'sim.statevector.html#statevectorsimulator.measure',
-                                                                                                   'qsample/sim/statevector.py')},
+                                                                                                   'qsample/sim/statevector.py'),
+                                         'qsample.sim.statevector.StatevectorSimulator.measure_joint': ( 'sim.statevector.html#statevectorsimulator.measure_joint',
+                                                                                                         'qsample/sim/statevector.py'),
+                                         'qsample.sim.statevector.StatevectorSimulator.reset': ( 'sim.statevector.html#statevectorsimulator.reset',
+                                                                                                 'qsample/sim/statevector.py'),
+                                         'qsample.sim.statevector.StatevectorSimulator.restore': ( 'sim.statevector.html#statevectorsimulator.restore',
+                                                                                                   'qsample/sim/statevector.py'),
+                                         'qsample.sim.statevector.StatevectorSimulator.snapshot': ( 'sim.statevector.html#statevectorsimulator.snapshot',
+                                                                                                    'qsample/sim/statevector.py')},
             'qsample.utils': { 'qsample.utils.load': ('utils.html#load', 'qsample/utils.py'),
                                'qsample.utils.save': ('utils.html#save', 'qsample/utils.py')}}}
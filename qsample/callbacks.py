@@ -325,14 +325,13 @@ class VerboseCircuitExec(Callback):
     
     def on_circuit_end(self, sampler, local_vars):
         circuit = local_vars.get('circuit', None)
-        fault_circuit = local_vars.get('fault_circuit', None)
+        faults = local_vars.get('faults', None)
         name = local_vars.get('pnode', None)
         msmt = local_vars.get('msmt', None)
 
         if circuit == None:
             print(name)
         elif circuit.noisy:
-            faults = [(i,tick) for i, tick in enumerate(fault_circuit._ticks) if tick]
             print(f"{name} -> Faults: {faults} -> Msmt: {msmt}")
         elif "COR" in name:
             cor = [(i,tick) for i, tick in enumerate(circuit._ticks) if tick]
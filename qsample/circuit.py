@@ -1,7 +1,7 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/03_circuit.ipynb.
 
 # %% auto 0
-__all__ = ['GATES', 'unpack', 'draw_circuit', 'Circuit']
+__all__ = ['GATES', 'NON_CLIFFORD', 'unpack', 'draw_circuit', 'Circuit']
 
 # %% ../nbs/03_circuit.ipynb 3
 from collections.abc import MutableSequence
@@ -17,6 +17,8 @@ GATES = {
     "meas": {"measure"}
 }
 
+NON_CLIFFORD = {"T", "Td", "Rx", "Ry", "Rz"} # gates which tableau simulators can not apply
+
 # %% ../nbs/03_circuit.ipynb 5
 def unpack(seq):
     """Generator to unpack all values of dicts inside
@@ -105,7 +107,13 @@ class Circuit(MutableSequence):
     n_ticks : int
         Number of ticks in circuit
     id : str
-        Unique circuit identifier
+        Unique circuit identifier (hash of circuit content)
+    program : tuple
+        Compiled form of the circuit executed by the simulators
+    terminal_measurements : frozenset
+        Measurements which are the last operation on their qubit
+    clifford : bool
+        True if circuit contains no gates of `NON_CLIFFORD`
     """
     
     def __init__(self, ticks=None, noisy=True):
@@ -167,11 +175,98 @@ class Circuit(MutableSequence):
         """Number of ticks"""
         return len(self._ticks)
     
-    @property
+    @cached_property
     def id(self):
-        """Unique circuit identifier"""
-        return sha1((repr(self)).encode('UTF-8')).hexdigest()[:5]
+        """Unique circuit identifier
+        
+        Computed from the (order independent) content of the ticks and the
+        `noisy` flag, such that circuits with the same content share an id.
+        Short prefix of `digest` for display; caches which outlive a protocol
+        are keyed by `digest`.
+        """
+        return self.digest[:5]
+    
+    @cached_property
+    def digest(self):
+        """SHA-1 hex digest of the (order independent) content of the ticks and the `noisy` flag"""
+        ticks = [sorted((gate, sorted(qubits)) for gate, qubits in tick.items()) for tick in self._ticks]
+        return sha1((repr((ticks, self.noisy))).encode('UTF-8')).hexdigest()
 
+    @cached_property
+    def program(self):
+        """Compiled form of the circuit executed by the simulators
+        
+        Gate symbols are replaced by opcodes (indices into the list of symbols),
+        qubits are sorted and unpacked into argument tuples and measurements
+        are separated from the other gates of a tick, as they are executed at
+        the end of the tick.
+        
+        Returns
+        -------
+        tuple
+            (symbols, ticks), where ticks contains one (gates, measurements)
+            pair per tick, each a tuple of (opcode, arguments)
+        """
+        symbols = sorted({gate for tick in self._ticks for gate in tick})
+        opcodes = {gate: opcode for opcode, gate in enumerate(symbols)}
+        ticks = []
+        for tick in self._ticks:
+            gates, msmts = [], []
+            for gate, qubits in tick.items():
+                ops = msmts if 'measure' in gate else gates
+                ops.extend((opcodes[gate], (q,) if type(q)==int else q) for q in sorted(qubits))
+            ticks.append((tuple(gates), tuple(msmts)))
+        return tuple(symbols), tuple(ticks)
+
+    @cached_property
+    def clifford(self):
+        """True if circuit can be simulated by a tableau simulator"""
+        return not any(gate in NON_CLIFFORD for tick in self._ticks for gate in tick)
+    
+    @cached_property
+    def terminal_measurements(self):
+        """Measurements after which the measured qubit is not used anymore
+        
+        Returns
+        -------
+        frozenset
+            (tick index, qubit) of measurements which are the last use of their qubit
+        """
+        terminal, used = set(), set()
+        for tick_index in reversed(range(len(self._ticks))):
+            tick = self._ticks[tick_index]
+            for gate, qubits in tick.items():
+                if 'measure' in gate:
+                    terminal.update((tick_index, q) for q in qubits if q not in used)
+            used.update(unpack(tick))
+        return frozenset(terminal)
+
+    def relabel(self, mapping):
+        """Circuit with qubit labels replaced by `mapping[label]`
+        
+        The compiled program of the new circuit keeps the order of the gates
+        and measurements of this circuit (see `program`), i.e. measurement
+        results come out in the same order for any mapping.
+        
+        Parameters
+        ----------
+        mapping : dict
+            New label of each qubit of the circuit
+            
+        Returns
+        -------
+        Circuit
+            Relabeled circuit
+        """
+        relabel = lambda args: tuple(mapping[a] if type(a)==int else a for a in args) # keeps gate parameters (e.g. angles)
+        ticks = [{gate: {relabel(q) if isinstance(q, tuple) else mapping[q] for q in qubits} 
+                  for gate, qubits in tick.items()} for tick in self._ticks]
+        circuit = Circuit(ticks, noisy=self.noisy)
+        symbols, program = self.program
+        circuit.__dict__['program'] = symbols, tuple(tuple(tuple((opcode, relabel(args)) for opcode, args in ops) 
+                                                           for ops in tick) for tick in program)
+        return circuit
+    
     def draw(self, path=None, scale=2):
         """Draw the circuit"""
         return draw_circuit(self, path, scale)
@@ -1,12 +1,14 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/01_math.ipynb.
 
 # %% auto 0
-__all__ = ['comb', 'binom', 'joint_binom', 'Wilson_var', 'Wald_var', 'subset_cards', 'cartesian_product', 'subset_probs']
+__all__ = ['comb', 'log_comb', 'binom', 'log_binom', 'joint_binom', 'Wilson_var', 'Wald_var', 'subset_cards', 'cartesian_product',
+           'iter_subset_probs', 'subset_prob_table', 'subset_probs']
 
 # %% ../nbs/01_math.ipynb 3
 import numpy as np
-from scipy.special import factorial
+from scipy.special import gammaln, xlogy, xlog1py
 import itertools as it
+import heapq
 
 from fastcore.test import *
 
@@ -14,6 +16,8 @@ from fastcore.test import *
 def comb(n, k):
     """Vectorized combination: `comb(n,k)` = n! / ((n-k)!k!)
     
+    Evaluated in log-space (see `log_comb`), finite for large n.
+    
     Parameters
     ----------
     n : int or np.array of int
@@ -26,7 +30,13 @@ def comb(n, k):
     np.array
         Combination (choose k out of n)
     """
-    return factorial(n) / (factorial(k) * factorial(n-k))
+    return np.exp(log_comb(n, k))
+
+def log_comb(n, k):
+    """Vectorized logarithm of `comb(n,k)` (-inf for k < 0 or k > n)"""
+    n, k = np.asarray(n, dtype=float), np.asarray(k, dtype=float)
+    with np.errstate(invalid='ignore'):
+        return np.where((k < 0) | (k > n), -np.inf, gammaln(n + 1) - gammaln(k + 1) - gammaln(n - k + 1))
 
 # %% ../nbs/01_math.ipynb 5
 def binom(k, n, p):
@@ -53,8 +63,12 @@ def binom(k, n, p):
     np.array
         Value(s) of binomial distribution evaluated at k,n,p.
     """
-    k, n, p = np.array(k), np.array(n), np.array(p)
-    return comb(n,k) * p**k * (1-p)**(n-k)
+    return np.exp(log_binom(k, n, p))
+
+def log_binom(k, n, p):
+    """Vectorized logarithm of `binom(k,n,p)` (0 log 0 = 0, i.e. exact for p=0 and p=1)"""
+    k, n, p = np.asarray(k), np.asarray(n), np.asarray(p)
+    return log_comb(n, k) + xlogy(k, p) + xlog1py(n - k, -p)
 
 # %% ../nbs/01_math.ipynb 7
 def joint_binom(k, n, p):
@@ -84,7 +98,7 @@ def joint_binom(k, n, p):
     np.array
         Joint probability
     """
-    return np.prod(binom(k,n,p), axis=-1) # In case p is list of list: vector, else scalar
+    return np.exp(np.sum(log_binom(k,n,p), axis=-1)) # In case p is list of list: vector, else scalar
 
 # %% ../nbs/01_math.ipynb 9
 def Wilson_var(p, N):
@@ -177,7 +191,113 @@ def cartesian_product(list_of_sets):
     return list(it.product(*list_of_sets))
 
 # %% ../nbs/01_math.ipynb 15
-def subset_probs(circuit, error_model, prob):
+def iter_subset_probs(circuit, error_model, prob, max_weight=None):
+    """Lazily enumerate the subsets of `circuit` in order of decreasing
+    occurence probability at physical error rate `prob`.
+    
+    The joint probability is a product of one binomial per partition group,
+    each of which decreases monotonically away from its mode. The subsets are
+    thus visited best-first, starting from the joint mode, with a heap of
+    candidates that is only as large as the frontier of the visited subsets
+    (instead of the Cartesian product of all subset cardinalities, see
+    `subset_probs`).
+    
+    Example
+    -------
+    >> list(it.islice(iter_subset_probs(qsample.examples.por, qsample.noise.E1, 0.1), 2))
+    [((0,), 0.6561), ((1,), 0.2916)]
+    
+    Parameters
+    ----------
+    circuit : Circuit
+        Circuit wrt. which subset probabilities are calculated
+    error_model : ErrorModel
+        Error model by which to partition `circuit`
+    prob : float or list of float
+        Physical error probability (per partition group)
+    max_weight : int or None
+        If not None, only subsets with total weight up to `max_weight` are yielded
+        
+    Yields
+    ------
+    tuple
+        (subset, corresponding probability)
+    """
+    cards = [len(s) for s in error_model.partition(circuit).values()]
+    probs = np.broadcast_to(np.asarray(prob, dtype=float), (len(cards),))
+    log_probs = [log_binom(np.arange(card + 1), card, p) for card, p in zip(cards, probs)]
+    mode = tuple(int(np.argmax(lp)) for lp in log_probs)
+    log_prob = lambda subset: sum(lp[w] for lp, w in zip(log_probs, subset))
+    
+    heap, seen = [(-log_prob(mode), mode)], {mode}
+    while heap:
+        neg_log_prob, subset = heapq.heappop(heap)
+        if max_weight is None or sum(subset) <= max_weight:
+            yield subset, np.exp(-neg_log_prob)
+        for i, (w, m) in enumerate(zip(subset, mode)):
+            # step away from the mode; steps towards larger weights are pruned above
+            # `max_weight`, all other subsets are still reachable by decreasing steps first
+            for step in ((-1, 1) if w == m else (-1,) if w < m else (1,)):
+                if not 0 <= w + step <= cards[i]: continue
+                if step == 1 and max_weight is not None and sum(subset) + 1 > max_weight: continue
+                succ = subset[:i] + (w + step,) + subset[i+1:]
+                if succ not in seen:
+                    seen.add(succ)
+                    heapq.heappush(heap, (-log_prob(succ), succ))
+
+# %% ../nbs/01_math.ipynb 16
+def subset_prob_table(circuit, error_model, prob, subsets=None):
+    """Calculate occurence probabilities of subsets in `circuit` with physical
+    error rate(s) `prob` as one dense array, evaluated in a single vectorized pass.
+    
+    Example
+    -------
+    >> subset_prob_table(qsample.examples.por, qsample.noise.E1, [[0.1], [0.2]])
+    ([(0,), (1,), (2,), (3,), (4,)],
+     array([[0.6561, 0.4096],
+            [0.2916, 0.4096],
+            [0.0486, 0.1536],
+            [0.0036, 0.0256],
+            [0.0001, 0.0016]]))
+    
+    Parameters
+    ----------
+    circuit : Circuit
+        Circuit wrt. which subset probabilities are calculated
+    error_model : ErrorModel
+        Error model by which to partition `circuit`
+    prob : float, list of float or np.array of shape (*grid, number of partition groups)
+        Physical error probabilities
+    subsets : iterable of tuple or None
+        If not None, only the probabilities of `subsets` are calculated, else of all subsets
+    
+    Returns
+    -------
+    tuple
+        (list of subsets, np.array of shape (number of subsets, *grid)), 
+        row i holds the probabilities of subset i
+    """
+    cards = [len(s) for s in error_model.partition(circuit).values()]
+    prob = np.asarray(prob, dtype=float)
+    
+    if subsets is not None:
+        subsets = list(subsets)
+        p = prob if prob.ndim == 0 else prob[..., None, :]
+        log_probs = np.sum(log_binom(np.array(subsets).reshape(len(subsets), len(cards)), cards, p), axis=-1)
+        return subsets, np.ascontiguousarray(np.moveaxis(np.exp(log_probs), -1, 0))
+    
+    # log probabilities of all weights of each group, broadcast against each other: shape (*(card + 1), *grid)
+    log_probs = 0
+    for i, card in enumerate(cards):
+        p = prob if prob.ndim == 0 else prob[..., i]
+        weights = np.arange(card + 1).reshape((1,) * i + (-1,) + (1,) * (len(cards) - i - 1) + (1,) * p.ndim)
+        log_probs = log_probs + log_binom(weights, card, p)
+    shape = [card + 1 for card in cards]
+    probs = np.exp(log_probs) # only exponentiated once all groups are combined
+    return list(np.ndindex(*shape)), probs.reshape(-1, *probs.shape[len(shape):])
+
+# %% ../nbs/01_math.ipynb 17
+def subset_probs(circuit, error_model, prob, min_prob=None, max_weight=None, subsets=None):
     """Calculate occurence probability of subsets in `circuit` with physical
     error rate `prob`. `error_model` defines how the circuit is to be 
     partitioned before occurence probabilities are calculated.
@@ -199,12 +319,26 @@ def subset_probs(circuit, error_model, prob):
         Error model by which to partition `circuit`
     prob : float or list of float
         Physical error probabilities 
+    min_prob : float or None
+        If not None, subsets with probability below `min_prob` at `prob` (one
+        float per partition group) are dropped (see `iter_subset_probs`)
+    max_weight : int or None
+        If not None, subsets with total weight above `max_weight` are dropped
+    subsets : iterable of tuple or None
+        If not None, only the probabilities of `subsets` are calculated
+        
     Returns
     -------
     dict
-        keys: subset, values: corresponding probability
+        keys: subset, values: corresponding probability. With `min_prob` or
+        `max_weight` the values do not sum to one, the remainder is the
+        probability mass of the truncated subsets. The 0-subset is never dropped.
     """
-    list_of_sets = error_model.group(circuit).values()
-    cards = list(map(len, list_of_sets))
-    cp_subset_cards = cartesian_product([subset_cards(s) for s in list_of_sets])
-    return {cp : joint_binom(cp, cards, prob) for cp in cp_subset_cards}
+    if min_prob is not None or max_weight is not None:
+        truncated = it.takewhile(lambda item: min_prob is None or item[1] >= min_prob, 
+                                 iter_subset_probs(circuit, error_model, prob, max_weight))
+        probs = dict(truncated)
+        zero = tuple(0 for _ in error_model.partition(circuit))
+        return probs if zero in probs else {zero: subset_probs(circuit, error_model, prob, subsets=[zero])[zero], **probs}
+    
+    return dict(zip(*subset_prob_table(circuit, error_model, prob, subsets)))
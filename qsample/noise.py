@@ -5,6 +5,9 @@ __all__ = ['DEPOLAR1', 'DEPOLAR2', 'XFLIP', 'ZFLIP', 'ErrorModel', 'E0', 'E1', '
 
 # %% ../nbs/07_noise.ipynb 3
 import numpy as np
+import itertools as it
+from collections import OrderedDict
+from math import comb, prod
 from .circuit import Circuit, GATES, unpack
 
 # %% ../nbs/07_noise.ipynb 5
@@ -21,43 +24,134 @@ class ErrorModel:
     """Representation of an incoherent error model."""
     
     groups = []
+    errsets = {}
+    
+    _partitions = OrderedDict() # (error model class, circuit digest) -> groups of fault locations
+    partitions_maxsize = 1024 # maximum number of stored partitions (least recently used dropped)
     
     def group(self, circuit):
         """Must be implemented by subclass"""
         raise NotImplemented
         
+    def partition(self, circuit) -> dict:
+        """Groups of fault locations of `circuit` (see `group`), computed once
+        per error model class and circuit content (`Circuit.digest`) and shared
+        by all users"""
+        key = (type(self), circuit.digest)
+        if key in self._partitions:
+            self._partitions.move_to_end(key)
+        else:
+            self._partitions[key] = self.group(circuit)
+            if len(self._partitions) > self.partitions_maxsize:
+                self._partitions.popitem(last=False)
+        return self._partitions[key]
+        
+    def errset(self, grp, loc):
+        """Set of faults which can occur at location `loc` of group `grp`"""
+        return self.errsets[grp]
+        
+    _tables = {} # id of error set -> (error set, sorted tuple of its faults)
+    
+    def _table(self, grp, loc) -> tuple:
+        """Faults of `self.errset(grp, loc)` as sorted tuple (same order in
+        every process, unlike iteration over a set), cached per error set"""
+        errset = self.errset(grp, loc)
+        entry = self._tables.get(id(errset))
+        if entry is None or entry[0] is not errset:
+            entry = self._tables[id(errset)] = (errset, tuple(sorted(errset)))
+        return entry[1]
+        
     def generate(self, fgroups, circuit):
-        """Must be implemented by subclass"""
-        raise NotImplemented
+        """Choose one fault of `self.errset` at random for each location in fgroups
+        
+        The random numbers for all locations are drawn at once and index into
+        the sorted fault tables (see `_table`)."""
+        grp_locs = [(grp, loc) for grp, locs in fgroups.items() for loc in locs]
+        draws = np.random.random(len(grp_locs))
+        for (grp, loc), u in zip(grp_locs, draws):
+            table = self._table(grp, loc)
+            yield loc, table[int(u * len(table))]
   
+    @staticmethod
+    def _sample(locs: list, k: int) -> list:
+        """k distinct elements of `locs` chosen uniformly at random (in order of `locs`)
+        
+        Floyd's algorithm: O(k) random numbers instead of a permutation of `locs`.
+        """
+        n = len(locs)
+        if k == 0:
+            return []
+        draws = (np.random.random(k) * np.arange(n - k + 1, n + 1)).astype(int) # uniform in [0, j] for j = n-k..n-1
+        chosen = set()
+        for j, t in zip(range(n - k, n), draws):
+            chosen.add(j if t in chosen else t)
+        return [locs[i] for i in sorted(chosen)]
+    
     @staticmethod
     def choose_p(groups: dict, probs: list):
-        """Select elements from group g_i with probability p_i."""
-        return {grp: [loc for loc in locs if np.random.random() < prob] 
+        """Select elements from group g_i with probability p_i.
+        
+        The number of selected elements is drawn from the binomial
+        distribution, the elements are then chosen by `_sample`."""
+        return {grp: ErrorModel._sample(locs, np.random.binomial(len(locs), prob)) 
                 for (grp,locs), prob in zip(groups.items(), probs)}
     
     @staticmethod
     def choose_w(groups: dict, weights: list):
         """Select w_i locations for group g_i in groups"""
-        return {grp: [locs[i] for i in np.random.choice(len(locs), weight, replace=False)]
+        return {grp: ErrorModel._sample(locs, weight)
                 for (grp,locs),weight in zip(groups.items(), weights)}
     
+    def faults(self, circuit, fgroups):
+        """Generate faults by `self.generate` for the locations in fgroups as
+        list of (tick, qubit, fault gate) sorted by tick.
+        
+        Sparse alternative to `run`: no allocation proportional to the circuit
+        depth, and an empty list without calling `self.generate` if no location
+        was chosen."""
+        if not any(fgroups.values()):
+            return []
+        return self._fault_list(self.generate(fgroups, circuit))
+    
+    @staticmethod
+    def _fault_list(loc_faults):
+        """Sorted list of (tick, qubit, fault gate) from pairs of location and fault"""
+        faults = set()
+        for (tidx, qb), fop in loc_faults:
+            if isinstance(qb, tuple):
+                faults.update((tidx, q, op) for q, op in zip(qb, fop) if op != "I")
+            elif isinstance(qb, int):
+                faults.add((tidx, qb, fop))
+        return sorted(faults)
+    
+    def enumerate_w(self, groups: dict, weights: list):
+        """All fault configurations with w_i faulty locations in group g_i with
+        their probabilities given the subset (exhaustive version of `choose_w`
+        followed by `faults`)
+        
+        Yields
+        ------
+        tuple
+            (probability, list of (tick, qubit, fault gate))
+        """
+        loc_choices = [[(1 / comb(len(locs), weight), [(grp, loc) for loc in chosen]) 
+                        for chosen in it.combinations(locs, weight)]
+                       for (grp, locs), weight in zip(groups.items(), weights)]
+        for choice in it.product(*loc_choices):
+            prob = prod(p for p, _ in choice)
+            grp_locs = [grp_loc for _, grp_locs in choice for grp_loc in grp_locs]
+            errsets = [self._table(grp, loc) for grp, loc in grp_locs]
+            prob /= prod(len(errset) for errset in errsets)
+            for fops in it.product(*errsets):
+                yield prob, self._fault_list(zip([loc for _, loc in grp_locs], fops))
+    
     def run(self, circuit, fgroups):
         """Generate new Circuit of same length as `Circuit` with faults generated
         by `self.generate` and corresponding location for each group in fgroups."""
         fault_circuit = Circuit([{} for _ in range(circuit.n_ticks)])
         
-        for (tidx, qb), fop in self.generate(fgroups, circuit):
-            if isinstance(qb, tuple):
-                for q,op in zip(qb,fop):
-                    if op == "I": continue
-                    qbs = fault_circuit[tidx].get(op,set())
-                    qbs.add(q)
-                    fault_circuit[tidx][op] = qbs
-            elif isinstance(qb, int):
-                qbs = fault_circuit[tidx].get(fop,set())
-                qbs.add(qb)
-                fault_circuit[tidx][fop] = qbs
+        for tidx, q, op in self.faults(circuit, fgroups):
+            fault_circuit[tidx].setdefault(op, set()).add(q)
         return fault_circuit 
 
 # %% ../nbs/07_noise.ipynb 7
@@ -69,6 +163,9 @@ class E0(ErrorModel):
     def group(self, circuit):
         return {"0": {}}
     
+    def faults(self, *args, **kwargs):
+        return []
+    
     def run(self, *args, **kwargs):
         return None
 
@@ -77,84 +174,65 @@ class E1(ErrorModel):
     """One prob/weight for all 1- and 2-qubit gates"""
     
     groups = ["q"]
+    errsets = {
+        "q1": DEPOLAR1,
+        "q2": DEPOLAR2
+    }
     
     def group(self, circuit):
         gates = GATES["q1"] | GATES["q2"]
         return {"q": [(ti,q) for ti,t in enumerate(circuit) for g,qs in t.items() for q in qs if g in gates]}
     
-    def generate(self, fgroups, circuit):
-        
-        errsets = {
-            "q1": DEPOLAR1,
-            "q2": DEPOLAR2
-        }
-                
-        for grp, locs in fgroups.items():
-            for loc in locs:
-                if isinstance(loc[1], tuple):
-                    errset = errsets["q2"]
-                else:
-                    errset = errsets["q1"]
-                fop = list(errset)[np.random.choice(len(errset))]
-                yield loc, fop
+    def errset(self, grp, loc):
+        return self.errsets["q2"] if isinstance(loc[1], tuple) else self.errsets["q1"]
 
 # %% ../nbs/07_noise.ipynb 9
 class E1_1(ErrorModel):
     """One prob/weight for all 1- and 2-qubit gates and measurements"""
     
     groups = ["q"]
+    errsets = {
+        "q1": DEPOLAR1,
+        "q2": DEPOLAR2
+    }
     
     def group(self, circuit):
         gates = GATES["q1"] | GATES["q2"] | GATES["meas"]
         return {"q": [(ti,q) for ti,t in enumerate(circuit) for g,qs in t.items() for q in qs if g in gates]}
     
-    def generate(self, fgroups, circuit):
-        
-        errsets = {
-            "q1": DEPOLAR1,
-            "q2": DEPOLAR2
-        }
-                
-        for grp, locs in fgroups.items():
-            for loc in locs:
-                if isinstance(loc[1], tuple):
-                    errset = errsets["q2"]
-                else:
-                    errset = errsets["q1"]
-                fop = list(errset)[np.random.choice(len(errset))]
-                yield loc, fop
+    def errset(self, grp, loc):
+        return self.errsets["q2"] if isinstance(loc[1], tuple) else self.errsets["q1"]
 
 # %% ../nbs/07_noise.ipynb 10
 class E2(ErrorModel):
     """Individual errors on 1-qubit and 2-qubit gates."""
     
     groups = ["q1", "q2"]
+    errsets = {
+        "q1": DEPOLAR1,
+        "q2": DEPOLAR2
+    }
     
     def group(self, circuit):
         gates = {"q1": GATES["q1"], "q2": GATES["q2"]}
         return {grp: [(ti,q) for ti,t in enumerate(circuit) for g,qs in t.items() 
                       for q in qs if g in gset] for grp,gset in gates.items()}
     
-    def generate(self, fgroups, circuit):
-        errsets = {
-            "q1": DEPOLAR1,
-            "q2": DEPOLAR2
-        }
-        
-        for grp, locs in fgroups.items():
-            for loc in locs:
-                if isinstance(loc[1], tuple):
-                    errset = errsets["q2"]
-                else:
-                    errset = errsets["q1"]
-                fop = list(errset)[np.random.choice(len(errset))]
-                yield loc, fop
+    def errset(self, grp, loc):
+        return self.errsets["q2"] if isinstance(loc[1], tuple) else self.errsets["q1"]
 
 # %% ../nbs/07_noise.ipynb 11
 class E3(ErrorModel):
     """Errors on all gates individual + idle."""
     
     groups = ["q1", "q2", "meas", "idle", "init"]
+    errsets = {
+        'q1': DEPOLAR1,
+        'q2': DEPOLAR2,
+        'meas': XFLIP,
+        'idle': ZFLIP,
+        'init': XFLIP   
+    }
     
     def group(self, circuit):
         groups =  {grp: [(ti,q) for ti,t in enumerate(circuit) for g,qs in t.items() 
@@ -162,27 +240,20 @@ class E3(ErrorModel):
         qbs = set(unpack(circuit))
         groups['idle'] = [(ti,q) for ti,t in enumerate(circuit) for q in qbs.difference(set(unpack(t)))]
         return groups
-    
-    def generate(self, fgroups, circuit):
-        
-        errsets = {
-            'q1': DEPOLAR1,
-            'q2': DEPOLAR2,
-            'meas': XFLIP,
-            'idle': ZFLIP,
-            'init': XFLIP   
-        }
-        
-        for grp, locs in fgroups.items():
-            for loc in locs:
-                fop = list(errsets[grp])[np.random.choice(len(errsets[grp]))]
-                yield loc, fop
 
 # %% ../nbs/07_noise.ipynb 12
 class E3_1(ErrorModel):
     """Like E3, but idle locations split in two subsets."""
     
     groups = ["q1", "q2", "meas", "idle1", "idle2", "init"]
+    errsets = {
+        'q1': DEPOLAR1,
+        'q2': DEPOLAR2,
+        'meas': XFLIP,
+        'idle1': DEPOLAR1,
+        'idle2': DEPOLAR1,
+        'init': XFLIP   
+    }
     
     def group(self, circuit):
         groups =  {i: [(ti,q) for ti,t in enumerate(circuit) for g,qs in t.items() 
@@ -195,27 +266,17 @@ class E3_1(ErrorModel):
                            for q in qbs.difference(set(unpack(t))) 
                            if any([op in GATES['q2'] for op in t.keys()])]
         return groups
-    
-    def generate(self, fgroups, circuit):
-        
-        errsets = {
-            'q1': DEPOLAR1,
-            'q2': DEPOLAR2,
-            'meas': XFLIP,
-            'idle1': DEPOLAR1,
-            'idle2': DEPOLAR1,
-            'init': XFLIP   
-        }
-        
-        for grp, locs in fgroups.items():
-            for loc in locs:
-                fop = list(errsets[grp])[np.random.choice(len(errsets[grp]))]
-                yield loc, fop
 
 # %% ../nbs/07_noise.ipynb 13
 class S4(ErrorModel):
     """Depolarizing noise on all operations, 4 parameters"""
     groups = ["q1", "q2", "meas", "init"]
+    errsets = {
+        'q1': DEPOLAR1,
+        'q2': DEPOLAR2,
+        'meas': DEPOLAR1,
+        'init': DEPOLAR1
+    }
 
     def group(self, circuit):
         groups = {grp: [(ti, q) for ti, t in enumerate(circuit) for g, qs in t.items()
@@ -223,20 +284,6 @@ class S4(ErrorModel):
         qbs = set(unpack(circuit))
         return groups
 
-    def generate(self, fgroups, circuit):
-
-        errsets = {
-            'q1': DEPOLAR1,
-            'q2': DEPOLAR2,
-            'meas': DEPOLAR1,
-            'init': DEPOLAR1
-        }
-
-        for grp, locs in fgroups.items():
-            for loc in locs:
-                fop = list(errsets[grp])[np.random.choice(len(errsets[grp]))]
-                yield loc, fop
-
 # %% ../nbs/07_noise.ipynb 14
 class S1(ErrorModel):
     """Single parameter depolarizing noise on all operations
@@ -245,28 +292,19 @@ class S1(ErrorModel):
     
     """
     groups = ["q"]
+    errsets = {
+        "q1": DEPOLAR1,
+        "q2": DEPOLAR2,
+        'meas': DEPOLAR1,
+        'init': DEPOLAR1
+    }
 
     def group(self, circuit):
         gates = GATES["q1"] | GATES["q2"] | GATES["meas"] | GATES["init"]
         return {"q": [(ti, q) for ti, t in enumerate(circuit) for g, qs in t.items() for q in qs if g in gates]}
 
-    def generate(self, fgroups, circuit):
-
-        errsets = {
-            "q1": DEPOLAR1,
-            "q2": DEPOLAR2,
-            'meas': DEPOLAR1,
-            'init': DEPOLAR1
-        }
-
-        for grp, locs in fgroups.items():
-            for loc in locs:
-                if isinstance(loc[1], tuple):
-                    errset = errsets["q2"]
-                else:
-                    errset = errsets["q1"]
-                fop = list(errset)[np.random.choice(len(errset))]
-                yield loc, fop
+    def errset(self, grp, loc):
+        return self.errsets["q2"] if isinstance(loc[1], tuple) else self.errsets["q1"]
 
 # %% ../nbs/07_noise.ipynb 15
 class S2(ErrorModel):
@@ -276,23 +314,15 @@ class S2(ErrorModel):
     
     """
     groups = ["q1", "q2"]
+    errsets = {
+        "q1": DEPOLAR1,
+        "q2": DEPOLAR2
+    }
 
     def group(self, circuit):
         gates = {"q1": GATES["q1"] | GATES["meas"] | GATES["init"], "q2": GATES["q2"]}
         return {grp: [(ti, q) for ti, t in enumerate(circuit) for g, qs in t.items()
                       for q in qs if g in gset] for grp, gset in gates.items()}
 
-    def generate(self, fgroups, circuit):
-        errsets = {
-            "q1": DEPOLAR1,
-            "q2": DEPOLAR2
-        }
-
-        for grp, locs in fgroups.items():
-            for loc in locs:
-                if isinstance(loc[1], tuple):
-                    errset = errsets["q2"]
-                else:
-                    errset = errsets["q1"]
-                fop = list(errset)[np.random.choice(len(errset))]
-                yield loc, fop
+    def errset(self, grp, loc):
+        return self.errsets["q2"] if isinstance(loc[1], tuple) else self.errsets["q1"]
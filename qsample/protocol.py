@@ -1,7 +1,7 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/04_protocol.ipynb.
 
 # %% auto 0
-__all__ = ['draw_protocol', 'Protocol']
+__all__ = ['draw_protocol', 'live_ranges', 'QubitMap', 'Protocol']
 
 # %% ../nbs/04_protocol.ipynb 3
 import networkx as nx
@@ -63,6 +63,90 @@ def draw_protocol(protocol, path=None, legend=False, figsize=(6,6), label_offset
     elif path: plt.savefig(path, bbox_inches='tight')
 
 # %% ../nbs/04_protocol.ipynb 5
+def live_ranges(circuit) -> tuple:
+    """Tick ranges in which the qubits of `circuit` hold a state
+    
+    A range starts at an `init` of the qubit and ends at its last use before
+    the next `init` (or the end of the circuit). Qubits used before their
+    first `init` are live from the start of the circuit (live-in), i.e. they
+    carry state from previous circuits of a protocol.
+    
+    Parameters
+    ----------
+    circuit : Circuit
+        Circuit to analyze
+    
+    Returns
+    -------
+    tuple
+        ({qubit: list of [first tick, last tick]}, set of live-in qubits)
+    """
+    ranges, live_in = {}, set()
+    for tick_index, tick in enumerate(circuit):
+        for gate, qubits in tick.items():
+            for q in unpack(qubits):
+                if type(q) != int: continue # gate parameters
+                if gate == "init":
+                    ranges.setdefault(q, []).append([tick_index, tick_index])
+                elif q in ranges:
+                    ranges[q][-1][1] = tick_index
+                else:
+                    live_in.add(q)
+                    ranges[q] = [[0, tick_index]]
+    return ranges, live_in
+
+# %% ../nbs/04_protocol.ipynb 6
+class QubitMap(dict):
+    """Map of qubit labels to slots of the simulated register
+    
+    Circuits and faults are relabeled before they are passed to the
+    simulator (see `run`). If slots are shared by qubits with disjoint live
+    ranges (see `Protocol.qubit_map`), faults on qubits outside of their live
+    ranges are dropped: they act on a state which is discarded by the next
+    `init` of the qubit, but could act on another qubit in the same slot.
+    
+    Attributes
+    ----------
+    n_qubits : int
+        Size of the simulated register
+    live : dict or None
+        Live ranges per circuit id (see `live_ranges`), None if slots are not shared
+    """
+    
+    def __init__(self, mapping, live=None):
+        super().__init__(mapping)
+        self.n_qubits = max(self.values(), default=-1) + 1
+        self.live = live
+        self.identity = live is None and all(q == slot for q, slot in self.items())
+        self._circuits = {}
+        
+    def circuit(self, circuit):
+        """Relabeled `circuit` (see `Circuit.relabel`), cached by circuit id"""
+        if self.identity:
+            return circuit
+        if circuit.id not in self._circuits:
+            self._circuits[circuit.id] = circuit.relabel(self)
+        return self._circuits[circuit.id]
+    
+    def faults(self, circuit, faults):
+        """Relabeled list of faults (see `ErrorModel.faults`) of `circuit`"""
+        if self.identity or not faults:
+            return faults
+        if not isinstance(faults, list): # fault circuit
+            return faults.relabel(self)
+        if self.live and circuit.id in self.live:
+            ranges, live_in = self.live[circuit.id]
+            faults = [(t, q, op) for t, q, op in faults 
+                      if q in live_in or any(start <= t <= stop for start, stop in ranges.get(q, []))]
+        return [(t, self[q], op) for t, q, op in faults]
+    
+    def run(self, run, circuit, faults=None):
+        """Call `run` (e.g. `state.run`) with relabeled `circuit` and `faults`"""
+        if self.identity:
+            return run(circuit, faults)
+        return run(self.circuit(circuit), self.faults(circuit, faults))
+
+# %% ../nbs/04_protocol.ipynb 7
 class Protocol(nx.DiGraph):
     """Representation of a Quantum (Error Correction) Protocol
     
@@ -192,6 +276,42 @@ class Protocol(nx.DiGraph):
                 return succ_name, check_return
             return succ_name, self.get_circuit(succ_name)
         
+    def qubit_map(self, reuse=False):
+        """Dense map of the qubit labels of the protocol to register slots
+        
+        Without `reuse` the qubits are numbered in order of their labels. With
+        `reuse`, qubits which are live-in (see `live_ranges`) in any circuit
+        keep a slot of their own, while all other qubits (ancillas which are
+        initialized before each use) share slots with qubits whose live ranges
+        do not overlap with theirs in any circuit. The register size is then
+        the maximum number of qubits live at the same time.
+        
+        Parameters
+        ----------
+        reuse : bool
+            If true, qubits with disjoint live ranges share slots
+            
+        Returns
+        -------
+        QubitMap
+            Map of labels to slots
+        """
+        labels = sorted(q for q in self.qubits if type(q) == int) # without gate parameters
+        if not reuse:
+            return QubitMap({q: slot for slot, q in enumerate(labels)})
+        
+        live = {cid: live_ranges(circuit) for cid, circuit in self.circuits.items()}
+        persistent = set().union(*[live_in for _, live_in in live.values()])
+        mapping = {q: slot for slot, q in enumerate(q for q in labels if q in persistent)}
+        
+        overlap = lambda r1, r2: any(a1 <= b2 and a2 <= b1 for a1, b1 in r1 for a2, b2 in r2)
+        for q in labels:
+            if q in persistent: continue
+            taken = set(range(len(persistent))) | {mapping[p] for p in mapping if any(
+                overlap(ranges.get(q, []), ranges.get(p, [])) for ranges, _ in live.values())}
+            mapping[q] = min(set(range(len(taken) + 1)) - taken)
+        return QubitMap(mapping, live)
+    
     def draw(self, *args, **kwargs):
         """Draw protocol"""
         return draw_protocol(self, *args, **kwargs)
@@ -5,9 +5,12 @@ __all__ = ['DirectSampler']
 
 # %% ../../nbs/06c_sampler.direct.ipynb 3
 import numpy as np
+from functools import partial
 import qsample.math as math
 import qsample.utils as utils
 from tqdm.auto import tqdm
+from .memo import OutcomeCache
+from ..sim.mixin import CircuitRunnerMixin
 from ..callbacks import CallbackList
 
 # %% ../../nbs/06c_sampler.direct.ipynb 4
@@ -30,9 +33,13 @@ class DirectSampler:
         List to accumulate counts for "marked" events
     shots : np.array
         List to accumulate shots per physical error rate
+    cache : OutcomeCache
+        Memo of deterministic circuit runs
+    qubit_map : QubitMap
+        Slots of the qubits of `protocol` in the simulated register
     """
     
-    def __init__(self, protocol, simulator, err_model, err_params=None):
+    def __init__(self, protocol, simulator, err_model, err_params=None, cache_size=0, reuse_qubits=False):
         """
         Parameters
         ----------
@@ -44,14 +51,24 @@ class DirectSampler:
             Error model used in sampling process
         err_params : dict
             Physical error rates per faulty partition group at which plots generated.
+        cache_size : int
+            Maximum number of deterministic circuit runs to memoize (see `OutcomeCache`),
+            requires a simulator which supports `snapshot` and `restore`
+        reuse_qubits : bool
+            If true, qubits with disjoint live ranges share a slot of the
+            simulated register (see `Protocol.qubit_map`)
         """
+        if cache_size and simulator.snapshot is CircuitRunnerMixin.snapshot:
+            raise ValueError(f"cache_size > 0 requires a simulator with snapshot support, {simulator.__name__} has none")
         self.protocol = protocol
         self.simulator = simulator
         self.err_model = err_model()
         self.err_params = self.__err_params_to_matrix(err_params)
-        self.partitions = {cid: self.err_model.group(circuit) for cid, circuit in self.protocol.circuits.items()}
+        self.partitions = {cid: self.err_model.partition(circuit) for cid, circuit in self.protocol.circuits.items()}
         self.counts = np.array([0] * self.err_params.shape[0])
         self.shots = np.array([0] * self.err_params.shape[0])
+        self.cache = OutcomeCache(cache_size)
+        self.qubit_map = protocol.qubit_map(reuse=reuse_qubits)
         
     def __err_params_to_matrix(self, err_params):
         sorted_params = [err_params[k] for k in self.err_model.groups]
@@ -99,6 +116,8 @@ class DirectSampler:
             callbacks = CallbackList(sampler=self, callbacks=callbacks)
                     
         callbacks.on_sampler_begin()
+        state = self.simulator(self.qubit_map.n_qubits) # reused by all shots
+        checkpoints = {} # noiseless circuit prefixes, see `run_checkpointed`
         
         for i, p in enumerate(self.err_params):
             
@@ -110,19 +129,21 @@ class DirectSampler:
                 self.shots[i] += 1
                 callbacks.on_protocol_begin()
                 pnode = self.protocol.root # get protocol start node
-                state = self.simulator(len(self.protocol.qubits)) # init state
+                state.reset() # init state
                 msmt_hist = {} # init measurement history
                 
                 while True:
                     callbacks.on_circuit_begin()
                     pnode, circuit = self.protocol.successor(pnode, msmt_hist)
                     if circuit != None:
+                        run = state.run if msmt_hist else partial(state.run_checkpointed, checkpoints=checkpoints) # first circuit starts from |0...0>
+                        run = partial(self.cache.run, state, partial(self.qubit_map.run, run), fresh=not msmt_hist)
                         if not circuit.noisy:
-                            msmt = state.run(circuit)
+                            msmt = run(circuit)
                         else:
                             fault_locs = self.err_model.choose_p(self.partitions[circuit.id], p)
-                            fault_circuit = self.err_model.run(circuit, fault_locs)
-                            msmt = state.run(circuit, fault_circuit)
+                            faults = self.err_model.faults(circuit, fault_locs)
+                            msmt = run(circuit, faults)
                         msmt = msmt if msmt==None else int(msmt,2) # convert to int for comparison in checks
                         msmt_hist[pnode] = msmt_hist.get(pnode, []) + [msmt]
                     else:
@@ -0,0 +1,229 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/06b_sampler.memo.ipynb.
+
+# %% auto 0
+__all__ = ['OutcomeCache', 'SubsetProbCache']
+
+# %% ../../nbs/06b_sampler.memo.ipynb 3
+from collections import OrderedDict
+import pickle
+import os
+import numpy as np
+
+import qsample.math as math
+import qsample.utils as utils
+
+# %% ../../nbs/06b_sampler.memo.ipynb 4
+class OutcomeCache:
+    """LRU-bounded memo of circuit executions
+    
+    Stores the measurement outcome and the final state of a circuit run, keyed
+    by circuit content (`Circuit.digest`), fault list and input state. On a hit
+    the final state is restored instead of simulating the circuit again. Only runs in which all
+    measurements were deterministic (see `CircuitRunnerMixin.run`) are stored,
+    as only their outcome and final state are a function of the key.
+    Requires a simulator which supports `snapshot` and `restore`.
+    
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of stored runs (0: cache disabled)
+    hits : int
+        Number of runs served from the cache
+    misses : int
+        Number of runs simulated
+    """
+    
+    def __init__(self, maxsize=10_000):
+        """
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of stored runs (0: cache disabled)
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._runs = OrderedDict()
+        
+    def __len__(self):
+        return len(self._runs)
+        
+    def clear(self):
+        """Remove all stored runs and reset counters"""
+        self._runs.clear()
+        self.hits = self.misses = 0
+        
+    def key(self, state, circuit, faults=None, fresh=False):
+        """Key of a run of `circuit` with `faults` on `state`
+        
+        The input state is replaced by a marker if it does not influence the
+        run, i.e. if the state is fresh (|0...0>) or `circuit` initializes all
+        qubits in its first tick.
+        
+        Parameters
+        ----------
+        state : StabilizerSimulator or StatevectorSimulator
+            Input state of the run
+        circuit : Circuit
+            Circuit to run
+        faults : list or None
+            Sorted list of (tick, qubit, fault gate) (see `ErrorModel.faults`)
+        fresh : bool
+            If true `state` is |0...0>
+        """
+        if fresh or (circuit.n_ticks and len(circuit[0].get("init", ())) == state._n):
+            state_key = None
+        else:
+            state_key = pickle.dumps(state.snapshot())
+        return circuit.digest, tuple(faults or ()), state_key
+        
+    def run(self, state, run, circuit, faults=None, fresh=False):
+        """Run `circuit` with `faults` on `state` using `run`, or restore a stored run
+        
+        Parameters
+        ----------
+        state : StabilizerSimulator or StatevectorSimulator
+            State on which the circuit is executed
+        run : callable
+            Method executing the circuit on `state` (e.g. `state.run`)
+        circuit : Circuit
+            Circuit to run
+        faults : list or None
+            Sorted list of (tick, qubit, fault gate) (see `ErrorModel.faults`)
+        fresh : bool
+            If true `state` is |0...0>
+            
+        Returns
+        -------
+        str or None
+            Measurement results as bitstring (None if no measurements were made)
+        """
+        if not self.maxsize:
+            return run(circuit, faults)
+        
+        key = self.key(state, circuit, faults, fresh)
+        if key in self._runs:
+            self.hits += 1
+            self._runs.move_to_end(key)
+            msmt, snapshot = self._runs[key]
+            state.restore(snapshot)
+            return msmt
+        
+        self.misses += 1
+        msmt = run(circuit, faults)
+        if state.deterministic:
+            self._runs[key] = (msmt, state.snapshot())
+            if len(self._runs) > self.maxsize:
+                self._runs.popitem(last=False)
+        return msmt
+
+# %% ../../nbs/06b_sampler.memo.ipynb 5
+class SubsetProbCache:
+    """LRU-bounded memo of subset occurence probabilities (see `math.subset_probs`)
+    
+    The probabilities of a circuit only depend on the sizes of its partition
+    groups (see `ErrorModel.partition`), which form the key together with the
+    error parameters and the options of `math.subset_probs`. Circuits with the
+    same group sizes thus share a table. The parameters are quantized to single
+    precision, i.e. parameters equal up to rounding share a table as well. If a
+    `path` is given, the tables are loaded from it on construction and written
+    back by `flush` (called by `SubsetSampler` after computing its tables), so
+    they are reused across sessions.
+    
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of stored tables (0: cache disabled)
+    path : str or None
+        File the tables are persisted to
+    hits : int
+        Number of tables served from the cache
+    misses : int
+        Number of tables computed
+    unsaved : int
+        Number of tables computed since the last write to `path`
+    """
+    
+    def __init__(self, maxsize=128, path=None):
+        """
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of stored tables (0: cache disabled)
+        path : str or None
+            File the tables are loaded from (if it exists) and persisted to
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.unsaved = 0
+        self._tables = utils.load(path) if path and os.path.exists(path) else OrderedDict()
+        while len(self._tables) > self.maxsize:
+            self._tables.popitem(last=False)
+        
+    def __len__(self):
+        return len(self._tables)
+        
+    def clear(self):
+        """Remove all stored tables and reset counters (the tables persisted to
+        `self.path` are kept, i.e. not overwritten by a later `flush`)"""
+        self._tables.clear()
+        self.hits = self.misses = self.unsaved = 0
+        
+    def key(self, circuit, error_model, prob, min_prob=None, max_weight=None, subsets=None):
+        """Key of the subset probabilities of `circuit` (see `math.subset_probs` for parameters)"""
+        cards = tuple(len(s) for s in error_model.partition(circuit).values())
+        prob = np.asarray(prob, dtype=np.float32)
+        return cards, prob.shape, prob.tobytes(), min_prob, max_weight, None if subsets is None else tuple(subsets)
+        
+    def subset_probs(self, circuit, error_model, prob, min_prob=None, max_weight=None, subsets=None):
+        """Return stored or compute subset probabilities (see `math.subset_probs`)
+        
+        Parameters
+        ----------
+        circuit : Circuit
+            Circuit wrt. which subset probabilities are calculated
+        error_model : ErrorModel
+            Error model by which to partition `circuit`
+        prob : float or list of float
+            Physical error probabilities 
+        min_prob : float or None
+            If not None, subsets with probability below `min_prob` are dropped
+        max_weight : int or None
+            If not None, subsets with total weight above `max_weight` are dropped
+        subsets : iterable of tuple or None
+            If not None, only the probabilities of `subsets` are calculated
+            
+        Returns
+        -------
+        dict
+            keys: subset, values: corresponding probability (shared by all hits, not to be modified)
+        """
+        if not self.maxsize:
+            return math.subset_probs(circuit, error_model, prob, min_prob, max_weight, subsets)
+        
+        key = self.key(circuit, error_model, prob, min_prob, max_weight, subsets)
+        if key in self._tables:
+            self.hits += 1
+            self._tables.move_to_end(key)
+            return self._tables[key]
+        
+        self.misses += 1
+        probs = math.subset_probs(circuit, error_model, prob, min_prob, max_weight, subsets)
+        self._tables[key] = probs
+        if len(self._tables) > self.maxsize:
+            self._tables.popitem(last=False)
+        self.unsaved += 1
+        return probs
+    
+    def save(self, path=None):
+        """Write stored tables to `path` (default: `self.path`)"""
+        utils.save(self._tables, path or self.path)
+        if path is None or path == self.path:
+            self.unsaved = 0
+            
+    def flush(self):
+        """Write stored tables to `self.path` if tables were computed since the last write"""
+        if self.path and self.unsaved:
+            self.save()
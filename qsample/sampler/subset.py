@@ -5,6 +5,8 @@ __all__ = ['SubsetSampler']
 
 # %% ../../nbs/06d_sampler.subset.ipynb 3
 from .tree import Tree, Variable, Constant, Delta
+from .memo import OutcomeCache, SubsetProbCache
+from ..sim.mixin import CircuitRunnerMixin
 import qsample.math as math
 import qsample.utils as utils
 
@@ -12,6 +14,8 @@ from ..callbacks import CallbackList
 from tqdm.auto import tqdm
 
 import numpy as np
+import pickle
+from functools import partial
 
 # %% ../../nbs/06d_sampler.subset.ipynb 4
 class SubsetSampler:
@@ -37,8 +41,22 @@ class SubsetSampler:
         Grouping of faulty circuit elements fore each circuit in protocol
     tree : CountTree
         Tree data structure to keep track of sampled events
+    exact_weight : int
+        Subsets of paths with total weight up to `exact_weight` are enumerated exactly (see `_enumerate`)
+    exact : set
+        Subset nodes whose transitions were enumerated exactly, not counted in shots
+    cache : OutcomeCache
+        Memo of deterministic circuit runs
+    subset_cache : SubsetProbCache
+        Memo of subset occurence probabilities used in `stats`
+    truncated : dict
+        Probability mass at `p_max` of the subsets dropped per circuit (see
+        `min_subset_prob`), accounted for by the δ nodes of `tree`
+    qubit_map : QubitMap
+        Slots of the qubits of `protocol` in the simulated register
     """
-    def __init__(self, protocol, simulator, p_max, err_model, err_params=None, L=None):
+    def __init__(self, protocol, simulator, p_max, err_model, err_params=None, L=None, exact_weight=0, cache_size=0, reuse_qubits=False, 
+                 min_subset_prob=None, max_subset_weight=None, subset_cache=None):
         """
         Parameters
         ----------
@@ -54,16 +72,48 @@ class SubsetSampler:
             Physical error rates per faulty partition group at which plots generated.
             Should be less than p_max and it should be checked that at p_max all subsets
             scale similar. Only in this region can we use the subset sampler results.
+        L : int
+            Length of longest non-fail path (only relevant for F.T. protocols)
+        exact_weight : int
+            If > 0, enumerate all fault configurations of the subsets of paths with
+            total weight up to `exact_weight` before sampling, instead of Monte Carlo
+            estimating their transition rates (see `_enumerate`). Requires a simulator
+            which supports `snapshot` and `restore`.
+        cache_size : int
+            Maximum number of deterministic circuit runs to memoize (see `OutcomeCache`),
+            requires a simulator which supports `snapshot` and `restore`
+        reuse_qubits : bool
+            If true, qubits with disjoint live ranges share a slot of the
+            simulated register (see `Protocol.qubit_map`)
+        min_subset_prob : float or None
+            If not None, subsets with occurence probability below `min_subset_prob`
+            at `p_max` are never sampled. Avoids the enumeration of all subsets of
+            circuits with many locations or partition groups (see `math.subset_probs`).
+        max_subset_weight : int or None
+            If not None, subsets with total weight above `max_subset_weight` are never sampled
+        subset_cache : SubsetProbCache or None
+            Memo of subset occurence probabilities, e.g. shared between samplers or
+            persisted to disk. If None, a new in-memory `SubsetProbCache` is used.
         """
+        if (cache_size or exact_weight) and simulator.snapshot is CircuitRunnerMixin.snapshot:
+            raise ValueError(f"cache_size > 0 and exact_weight > 0 require a simulator with snapshot support, {simulator.__name__} has none")
         self.protocol = protocol
         self.simulator = simulator
         self.err_model = err_model()
         self.p_max = self.err_params_to_matrix(p_max)
         self.err_params = self.err_params_to_matrix(err_params)
         
-        self.partitions = {cid: self.err_model.group(circuit) for cid, circuit in self.protocol.circuits.items()}
-        constants = {cid: math.subset_probs(circuit, self.err_model, self.p_max) for cid, circuit in protocol.circuits.items()}
+        self.partitions = {cid: self.err_model.partition(circuit) for cid, circuit in self.protocol.circuits.items()}
+        self.subset_cache = SubsetProbCache() if subset_cache is None else subset_cache
+        constants = {cid: self.subset_cache.subset_probs(circuit, self.err_model, self.p_max, min_subset_prob, max_subset_weight) 
+                     for cid, circuit in protocol.circuits.items()}
+        self.subset_cache.flush()
+        self.truncated = {cid: 1 - sum(Aws.values()) for cid, Aws in constants.items()}
         self.tree = Tree(constants, L)
+        self.exact_weight = exact_weight
+        self.exact = set()
+        self.cache = OutcomeCache(cache_size)
+        self.qubit_map = protocol.qubit_map(reuse=reuse_qubits)
       
     def err_params_to_matrix(self, err_params):
         sorted_params = [err_params[k] for k in self.err_model.groups]
@@ -81,7 +131,9 @@ class SubsetSampler:
         """                    
         _constants = self.tree.constants
         prob = self.err_params if err_params == None else self.err_params_to_matrix(err_params)
-        self.tree.constants = {cid: math.subset_probs(circuit, self.err_model, prob) for cid, circuit in self.protocol.circuits.items()}
+        self.tree.constants = {cid: self.subset_cache.subset_probs(circuit, self.err_model, prob, subsets=_constants[cid]) 
+                               for cid, circuit in self.protocol.circuits.items()}
+        self.subset_cache.flush()
 
         
         p_L = self.tree.subtree_sum(self.tree.root, self.tree.marked)
@@ -98,7 +150,8 @@ class SubsetSampler:
     def _choose_subset(self, tnode, circuit):
         """Choose a subset for `circuit`, based on current `tnode`
         
-        Choice is based on subset occurence probability (Aws).
+        Choice is based on subset occurence probability (Aws), renormalized
+        to the subsets which are not truncated.
         
         See App. C3a in paper
         
@@ -115,8 +168,90 @@ class SubsetSampler:
             Next subset to choose for `tnode`
         """
         subsets, Aws = zip(*self.tree.constants[circuit.id].items())
-        return subsets[ np.random.choice(len(subsets), p=Aws) ]
-
+        return subsets[ np.random.choice(len(subsets), p=np.array(Aws) / sum(Aws)) ]
+    
+    def _enumerate(self, state, tnode, pnode, arrivals):
+        """Enumerate the transitions from the subsets of circuit node `tnode` up to total path weight `exact_weight`
+        
+        Each fault configuration of these subsets is simulated once on each
+        distinct input state of `tnode` (see `state_key`), following all
+        outcomes of random measurements (see `run_branches`). The successors
+        are added as `exact` nodes whose counts are their probabilities, and
+        are enumerated in turn with the final states of the runs as input
+        states. Subsets with runs which cannot be enumerated are left to Monte
+        Carlo sampling, as are circuits nested deeper than the number of
+        protocol nodes (loops).
+        
+        Parameters
+        ----------
+        state : StabilizerSimulator or StatevectorSimulator
+            Simulator used for the runs (state is overwritten)
+        tnode : Variable
+            Circuit node to enumerate
+        pnode : str
+            Protocol node of `tnode`
+        arrivals : dict
+            Input states of `tnode`: {key: (probability, snapshot, measurement history, circuit)}
+        """
+        circuit = next(iter(arrivals.values()))[3] # only corrections, which are not noisy, differ between arrivals
+        path_weight = self.tree.path_weight(tnode)
+        if circuit.noisy:
+            self.tree.add(name='δ', node_type=Delta, parent=tnode)
+            subsets = [ss for ss in self.tree.constants[circuit.id] if path_weight + sum(ss) <= self.exact_weight]
+        else:
+            subsets = [(0,)]
+            
+        for subset in subsets:
+            succ_arrivals = self._enumerate_subset(state, pnode, subset, arrivals)
+            if succ_arrivals is None:
+                continue
+            ss_node = self.tree.add(name=subset, parent=tnode, node_type=Constant, const_val=None if circuit.noisy else 1)
+            ss_node.count = sum(prob for prob, *_ in arrivals.values())
+            self.exact.add(ss_node)
+            for succ, succ_arrival in succ_arrivals.items():
+                succ_circuit = next(iter(succ_arrival.values()))[3]
+                succ_node = self.tree.add(name=succ, parent=ss_node, node_type=Variable, 
+                                          circuit_id=succ_circuit.id if succ_circuit else None, exact=True)
+                succ_node.count = sum(prob for prob, *_ in succ_arrival.values())
+                if succ_circuit is None:
+                    succ_node.invariant = True
+                    if succ != None:
+                        self.tree.marked.add(succ_node)
+                elif succ_node.depth < 2 * len(self.protocol):
+                    self._enumerate(state, succ_node, succ, succ_arrival)
+                    
+    def _enumerate_subset(self, state, pnode, subset, arrivals):
+        """Run all fault configurations of `subset` on all input states in `arrivals` (see `_enumerate`)
+        
+        Returns
+        -------
+        dict or None
+            Input states of the successors: {successor: arrivals}, None if the
+            runs could not be enumerated
+        """
+        run = partial(self.qubit_map.run, state.run)
+        configs = {} # per circuit id
+        succ_arrivals = {}
+        for prob, snapshot, msmt_hist, circuit in arrivals.values():
+            if circuit.id not in configs:
+                configs[circuit.id] = list(self.err_model.enumerate_w(self.partitions[circuit.id], subset)) if circuit.noisy else [(1, None)]
+            for fault_prob, faults in configs[circuit.id]:
+                state.restore(snapshot)
+                branches = state.run_branches(run, circuit, faults)
+                if branches is None:
+                    return None
+                for branch_prob, msmt, final in branches:
+                    msmt = msmt if msmt==None else int(msmt,2)
+                    hist = {**msmt_hist, pnode: msmt_hist.get(pnode, []) + [msmt]}
+                    succ, succ_circuit = self.protocol.successor(pnode, hist)
+                    key = None # final states of the protocol are not needed
+                    if succ_circuit:
+                        state.restore(final)
+                        key = state.state_key(), pickle.dumps(hist)
+                    succ_arrival = succ_arrivals.setdefault(succ, {})
+                    p = succ_arrival[key][0] if key in succ_arrival else 0
+                    succ_arrival[key] = (p + prob * fault_prob * branch_prob, final, hist, succ_circuit)
+        return succ_arrivals
         
     def run(self, n_shots, callbacks=[]):
         """Execute n_shots of subset sampling
@@ -135,11 +270,19 @@ class SubsetSampler:
         
         self.stop_sampling = False # Flag can be controlled in callbacks
         callbacks.on_sampler_begin()
+        state = self.simulator(self.qubit_map.n_qubits) # reused by all shots
+        checkpoints = {} # noiseless circuit prefixes, see `run_checkpointed`
+        
+        if self.exact_weight and self.tree.root is None: # enumerate once, before the first shot
+            pnode, circuit = self.protocol.successor(self.protocol.root, {})
+            tnode = self.tree.add(name=pnode, node_type=Variable, circuit_id=circuit.id)
+            state.reset()
+            self._enumerate(state, tnode, pnode, {None: (1, state.snapshot(), {}, circuit)})
         
         for _ in tqdm(range(n_shots), desc=f"p={tuple(map('{:.2e}'.format, self.p_max))}"):
             callbacks.on_protocol_begin()
             pnode = self.protocol.root # get protocol start node
-            state = self.simulator(len(self.protocol.qubits)) # init state
+            state.reset() # init state
             msmt_hist = {} # init measurement history
             tnode = None # init tree node
             
@@ -148,7 +291,8 @@ class SubsetSampler:
                 
                 pnode, circuit = self.protocol.successor(pnode, msmt_hist)
                 tnode = self.tree.add(name=pnode, parent=tnode, node_type=Variable)
-                tnode.count += 1
+                if not tnode.exact: # enumerated nodes are not counted in shots
+                    tnode.count += 1
                                 
                 path_weight = self.tree.path_weight(tnode)
                 if path_weight == 0:
@@ -164,11 +308,15 @@ class SubsetSampler:
                 if circuit != None:
                     tnode.circuit_id = circuit.id
                     
+                    run = state.run if msmt_hist else partial(state.run_checkpointed, checkpoints=checkpoints) # first circuit starts from |0...0>
+                    run = partial(self.cache.run, state, partial(self.qubit_map.run, run), fresh=not msmt_hist)
+                    
                     if not circuit.noisy:
-                        msmt = state.run(circuit)
+                        msmt = run(circuit)
                         # add 0-subset for not noisy circuits
                         tnode = self.tree.add(name=(0,), parent=tnode, node_type=Constant, const_val=1)
-                        tnode.count += 1
+                        if tnode not in self.exact:
+                            tnode.count += 1
                     else:
                         
                         # Circuit node
@@ -176,6 +324,8 @@ class SubsetSampler:
                         if self.protocol.fault_tolerant and self.tree.path_weight(tnode) == 0:
                             for virt_sskey in [sskey for sskey in self.tree.constants[circuit.id].keys() if sum(sskey) == 1]:
                                 ss_node = self.tree.add(name=virt_sskey, parent=tnode, node_type=Constant)
+                                if ss_node in self.exact: # successors known
+                                    continue
                                 # expand circuits and subsets for each virtual subset
                                 for vcirc_name in [n for n in self.protocol.successors(pnode)]:
                                     circuit_ = self.protocol.get_circuit(vcirc_name)
@@ -190,16 +340,17 @@ class SubsetSampler:
              
                         subset = self._choose_subset(tnode, circuit)
                         fault_locs = self.err_model.choose_w(self.partitions[circuit.id], subset)
-                        fault_circuit = self.err_model.run(circuit, fault_locs)
-                        msmt = state.run(circuit, fault_circuit)
+                        faults = self.err_model.faults(circuit, fault_locs)
+                        msmt = run(circuit, faults)
                                     
                         tnode = self.tree.add(name=subset, parent=tnode, node_type=Constant)
-                        tnode.count += 1
+                        if tnode not in self.exact:
+                            tnode.count += 1
                         
                         # Subset node
                         path_weight = self.tree.path_weight(tnode)
-                        # See App. B4 Case (I)
-                        if path_weight == 0:
+                        # See App. B4 Case (I), successors of enumerated subsets are known
+                        if path_weight == 0 or tnode in self.exact:
                             pass
                         else:
                             if self.protocol.fault_tolerant:
@@ -165,8 +165,12 @@ class Variable(Node):
         If true ...
     circuit_id : str
         Unique identifier of circuit associated to random variable
+    exact : bool
+        If true `count` holds exact (fractional) transition counts, i.e. variance is 0
     """
     
+    exact = False
+    
     def __init__(self, name, count=0, invariant=False, ff_deterministic=False, circuit_id=None, **kwargs):
         super().__init__(name=name, count=count, invariant=invariant, 
                          ff_deterministic=ff_deterministic, circuit_id=circuit_id, **kwargs)
@@ -206,7 +210,7 @@ class Variable(Node):
         float
             Value of variance of transition rate
         """
-        if self.is_root or self.invariant or self.parent.count == 0:
+        if self.is_root or self.invariant or self.exact or self.parent.count == 0:
             return 0.0
         return math.Wilson_var(self.rate, self.parent.count)
     
@@ -428,7 +432,7 @@ class Tree:
                 
         return VpE2 - E2
     
-    def subtree_sum(self, node, leaves):
+    def subtree_sum(self, node, leaves, memo=None):
         """Sum of paths from `node` to `leaves`
         
         Used e.g. in Eq. C9 in paper
@@ -440,15 +444,24 @@ class Tree:
         leaves : Set of Variable, Constant and/or Delta
             Consider only nodes in `leaves` as possible end nodes of paths from `node`
             in the calculation of the path products
+        memo : dict or None
+            Subtree sums wrt. `leaves` of already visited nodes, updated in place
             
         Returns
         -------
         float
             Sum of `node`'s subtree
         """
-        acc = 0
-        for leaf in set(node.leaves).intersection(leaves):
-            acc += self.path_prod(node, leaf)
+        if memo is not None and node in memo:
+            return memo[node]
+        # path products factored by common nodes: value(node) * sum of children's subtree sums
+        if node.is_leaf:
+            acc = self.value(node) if node in leaves else 0
+        else:
+            acc = sum(self.subtree_sum(child, leaves, memo) for child in node.children)
+            if np.any(acc): acc = self.value(node) * acc
+        if memo is not None:
+            memo[node] = acc
         return acc
     
     def var(self, mode=1):
@@ -475,11 +488,14 @@ class Tree:
             raise Exception(f"Unknown mode {mode}")
         
         # see Fig. 22 in paper
-        ix_nodes = set() # Intersection nodes, in paper "overlap" nodes
-        for (nodeA, nodeB) in it.combinations(leaves, 2):
-            common_nodes = list(n1 for n1,n2 in zip(nodeA.path, nodeB.path) if n1 == n2)
-            if len(common_nodes) > 0 and not common_nodes[-1].is_root:
-                ix_nodes.add(common_nodes[-1])
+        # Intersection nodes, in paper "overlap" nodes: last common node of the paths of
+        # any two leaves, i.e. nodes with leaves below more than one of their children
+        branches = {} # node: children with leaves in their subtree
+        for leaf in leaves:
+            for node in leaf.iter_path_reverse():
+                if node.is_root or node in branches.get(node.parent, ()): break # rest of path already seen
+                branches.setdefault(node.parent, set()).add(node)
+        ix_nodes = set(n for n, children in branches.items() if len(children) > 1 and not n.is_root)
                     
         acc = 0
         for leaf in leaves: # path variances
@@ -492,6 +508,7 @@ class Tree:
         for leaf in nf_leaves:
             acc += self.path_var(leaf, zero_leaf=True)
             
+        memo = {} # subtree sums wrt. leaves
         for ix_node in ix_nodes:
             cov = 0
             for (nodeA, nodeB) in it.combinations(ix_node.children, 2):
@@ -499,12 +516,12 @@ class Tree:
                 if type(ix_node) == Constant: # ignore branching ratio (is here random var)
                     accA, accB = 0, 0
                     for child in nodeA.children:
-                        accA += self.subtree_sum(child, leaves)
+                        accA += self.subtree_sum(child, leaves, memo)
                     for child in nodeB.children:
-                        accB += self.subtree_sum(child, leaves)
+                        accB += self.subtree_sum(child, leaves, memo)
                     cov += accA * accB
                 elif type(ix_node) == Variable:
-                    cov += self.subtree_sum(nodeA, leaves) * self.subtree_sum(nodeB, leaves)
+                    cov += self.subtree_sum(nodeA, leaves, memo) * self.subtree_sum(nodeB, leaves, memo)
                     
 
             if type(ix_node) == Constant:
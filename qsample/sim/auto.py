@@ -0,0 +1,111 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/05f_sim.auto.ipynb.
+
+# %% auto 0
+__all__ = ['AutoSimulator']
+
+# %% ../../nbs/05f_sim.auto.ipynb 3
+from .mixin import CircuitRunnerMixin
+from .stabilizer import StabilizerSimulator
+from .numpy_statevector import NumpyStatevectorSimulator
+
+import numpy as np
+
+# %% ../../nbs/05f_sim.auto.ipynb 4
+class AutoSimulator(CircuitRunnerMixin):
+    """Simulator which dispatches each circuit to a tableau or statevector simulator
+    
+    Circuits are run on a tableau simulator as long as all circuits of the
+    current shot are Clifford (see `Circuit.clifford`). At the first
+    non-Clifford circuit, the stabilizer state is converted to amplitudes
+    (see `to_statevector`) and the rest of the shot is run on a statevector
+    simulator. `reset` switches back to the tableau simulator, i.e.
+    protocols without non-Clifford circuits are never simulated on a
+    statevector.
+    
+    Attributes
+    ----------
+    _n : int
+        Number of qubits to simulate
+    tableau : StabilizerSimulator
+        Tableau simulator
+    statevector : NumpyStatevectorSimulator or None
+        Statevector simulator (created at the first non-Clifford circuit)
+    active : StabilizerSimulator or NumpyStatevectorSimulator
+        Simulator which holds the current state
+    """
+    
+    tableau_simulator = StabilizerSimulator
+    statevector_simulator = NumpyStatevectorSimulator
+    
+    def __init__(self, num_qubits):
+        """
+        Parameters
+        ----------
+        num_qubits : int
+            Number of qubits to simualate
+        """
+        self._n = num_qubits
+        self.tableau = self.tableau_simulator(num_qubits)
+        self.statevector = None
+        self.active = self.tableau
+        
+    def __getattr__(self, name):
+        """Gates and measurements of the active simulator"""
+        if name == "active": # not yet set (e.g. during unpickling)
+            raise AttributeError(name)
+        return getattr(self.active, name)
+        
+    def reset(self) -> None:
+        """Reset to |0...0> on the tableau simulator"""
+        self.tableau.reset()
+        self.active = self.tableau
+        
+    def snapshot(self) -> tuple:
+        """Copy of the state of the active simulator"""
+        return self.active is self.tableau, self.active.snapshot()
+    
+    def restore(self, snapshot: tuple) -> None:
+        """Overwrite the state with `snapshot`, switching the active simulator if needed"""
+        on_tableau, state = snapshot
+        if on_tableau:
+            self.active = self.tableau
+        else:
+            self.active = self.statevector = self.statevector or self.statevector_simulator(self._n)
+        self.active.restore(state)
+        
+    def to_statevector(self) -> None:
+        """Continue on the statevector simulator with the current stabilizer state
+        
+        The state is the projection of a random vector onto the common +1
+        eigenspace of the stabilizer generators, i.e. it is correct up to a
+        global phase.
+        """
+        if self.statevector is None:
+            self.statevector = self.statevector_simulator(self._n)
+        sv, n = self.statevector, self._n
+        sv._psi[...] = np.random.normal(size=sv._psi.shape) + 1j * np.random.normal(size=sv._psi.shape)
+        for x, z, r in zip(self.tableau._x[n:2*n], self.tableau._z[n:2*n], self.tableau._r[n:2*n]):
+            psi = sv.snapshot()
+            sv.paulis([("Y" if xq and zq else "X" if xq else "Z", q) for q, (xq, zq) in enumerate(zip(x, z)) if xq or zq])
+            sv._psi[...] = (psi - sv._psi if r else psi + sv._psi) / 2 # projector (1 + S) / 2 of stabilizer S
+        sv._psi /= np.linalg.norm(sv._psi)
+        self.active = sv
+        
+    def _dispatch(self, circuit) -> None:
+        """Switch to the statevector simulator if `circuit` is not Clifford"""
+        if self.active is self.tableau and not circuit.clifford:
+            self.to_statevector()
+        
+    def run(self, circuit, *args, **kwargs):
+        """Run `circuit` on the active simulator (see `CircuitRunnerMixin.run`)"""
+        self._dispatch(circuit)
+        msmt = self.active.run(circuit, *args, **kwargs)
+        self.deterministic = self.active.deterministic
+        return msmt
+    
+    def run_checkpointed(self, circuit, *args, **kwargs):
+        """Run `circuit` on the active simulator (see `CircuitRunnerMixin.run_checkpointed`)"""
+        self._dispatch(circuit)
+        msmt = self.active.run_checkpointed(circuit, *args, **kwargs)
+        self.deterministic = self.active.deterministic
+        return msmt
@@ -0,0 +1,189 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/05d_sim.frame.ipynb.
+
+# %% auto 0
+__all__ = ['ReferenceSimulator', 'PauliFrameSimulator']
+
+# %% ../../nbs/05d_sim.frame.ipynb 3
+from .mixin import CircuitRunnerMixin
+from .stabilizer import ChpSimulator, StabilizerSimulator, MeasureResult
+
+import numpy as np
+
+# %% ../../nbs/05d_sim.frame.ipynb 4
+class ReferenceSimulator(StabilizerSimulator):
+    """`StabilizerSimulator` which records all measurement results and resolves
+    random measurements deterministically to 0, i.e. produces one valid
+    noiseless reference run of a circuit.
+    
+    Attributes
+    ----------
+    results : list of MeasureResult
+        Results of the measurements made by `run` in order of occurence
+    """
+    
+    def run(self, circuit, fault_circuit=None):
+        self.results = []
+        return super().run(circuit, fault_circuit)
+    
+    def measure(self, qubit: int) -> MeasureResult:
+        """Measurement in Z basis (random outcomes resolved to 0)"""
+        res = ChpSimulator.measure(self, qubit, bias=0)
+        self.results.append(res)
+        return res
+
+# %% ../../nbs/05d_sim.frame.ipynb 5
+class PauliFrameSimulator(CircuitRunnerMixin):
+    """Pauli-frame simulator for noisy Clifford circuits
+    
+    The noiseless evolution of each circuit is simulated only once on a
+    `ReferenceSimulator` and cached, keyed by the circuit and the reference
+    state before it. Per shot only one X and one Z frame bit per qubit is
+    tracked. The frame is propagated through the Clifford gates, faults are
+    XORed into it and measurement outcomes are the reference outcomes XORed with
+    the X frame bit of the measured qubit. Random measurement outcomes follow
+    from randomized Z frame bits after initialization and measurement.
+    
+    Reference
+    ---------
+        https://arxiv.org/abs/2103.02202 (Sec. 3.2)
+    
+    Attributes
+    ----------
+    references : dict
+        Cache of reference runs. Keys: (circuit digest, tableau before run as bytes
+        or None for |0...0>), values: (reference measurement results, tableau after run).
+        Repeated circuits (e.g. repeat-until-success loops) which reach the same
+        reference state share one entry.
+    _n : int
+        Number of qubits to simulate
+    _x : np.array
+        X frame bits
+    _z : np.array
+        Z frame bits
+    _table : np.array or None
+        Reference tableau after the circuits executed since initialization (None: |0...0>)
+    """
+    
+    def __init__(self, num_qubits):
+        """
+        Parameters
+        ----------
+        num_qubits : int
+            Number of qubits to simualate
+        """
+        self._n = num_qubits
+        self.references = {}
+        self._x = np.zeros(num_qubits, dtype=bool)
+        self._z = np.empty(num_qubits, dtype=bool)
+        self.reset()
+        
+    def reset(self) -> None:
+        """Reset the frame and the reference state to |0...0>"""
+        self._x[:] = False
+        self._z[:] = np.random.random(self._n) < 0.5 # |0> is invariant under Z
+        self._table = None
+        
+    def _reference(self, circuit):
+        """Return (cached) reference measurement results of `circuit` on the reference state `_table`"""
+        key = (circuit.digest, None if self._table is None else self._table.tobytes())
+        if key not in self.references:
+            ref = ReferenceSimulator(self._n)
+            if self._table is not None:
+                ref._table[:] = self._table
+            ref.run(circuit)
+            self.references[key] = (ref.results, ref._table.copy())
+        results, self._table = self.references[key]
+        return results
+        
+    def run(self, circuit, fault_circuit=None):
+        """Apply gates in `circuit` and faults in `fault_circuit` to the Pauli frame
+        (see `CircuitRunnerMixin.run`)"""
+        self._ref_results = iter(self._reference(circuit))
+        return super().run(circuit, fault_circuit)
+    
+    def run_checkpointed(self, circuit, fault_circuit=None, checkpoints=None):
+        """Same as `run`: the noiseless evolution is cached in `references` already"""
+        return self.run(circuit, fault_circuit)
+    
+    def _apply_fault(self, gate_symbol, qubits) -> None:
+        """XOR Pauli fault `gate_symbol` into the frame"""
+        if gate_symbol in ("X", "Y"):
+            self._x[qubits] ^= True
+        if gate_symbol in ("Z", "Y"):
+            self._z[qubits] ^= True
+            
+    def init(self, qubit: int) -> None:
+        """Initialize to |0>
+        
+        Clears `deterministic` if the state of `qubit` was random in the
+        reference run (see `CircuitRunnerMixin.run`).
+        """
+        if not next(self._ref_results).determined: # reference run resets by measurement
+            self.deterministic = False
+        self._x[qubit] = False
+        self._z[qubit] = np.random.random() < 0.5
+    
+    def measure(self, qubit: int) -> MeasureResult:
+        """Measurement in Z basis"""
+        ref = next(self._ref_results)
+        res = MeasureResult(value=ref.value ^ self._x[qubit], determined=ref.determined)
+        self._z[qubit] = np.random.random() < 0.5 # collapse: Z frame of measured qubit irrelevant
+        return res
+        
+    def I(self, qubit: int) -> None:
+        """Identity gate"""
+        pass
+    
+    def X(self, qubit: int) -> None:
+        """X gate (commutes with frame up to sign)"""
+        pass
+    
+    def Y(self, qubit: int) -> None:
+        """Y gate (commutes with frame up to sign)"""
+        pass
+    
+    def Z(self, qubit: int) -> None:
+        """Z gate (commutes with frame up to sign)"""
+        pass
+    
+    def H(self, qubit: int) -> None:
+        """H gate: X <-> Z"""
+        self._x[qubit], self._z[qubit] = self._z[qubit], self._x[qubit]
+        
+    def S(self, qubit: int) -> None:
+        """Phase gate: X -> Y"""
+        self._z[qubit] ^= self._x[qubit]
+        
+    def Sd(self, qubit: int) -> None:
+        """S^(dagger) gate: X -> Y"""
+        self._z[qubit] ^= self._x[qubit]
+    
+    def Q(self, qubit: int) -> None:
+        """Q = sqrt(X) gate: Z -> Y"""
+        self._x[qubit] ^= self._z[qubit]
+        
+    def Qd(self, qubit: int) -> None:
+        """Q^(dagger) gate: Z -> Y"""
+        self._x[qubit] ^= self._z[qubit]
+        
+    def R(self, qubit: int) -> None:
+        """R = sqrt(XZ) gate: X <-> Z"""
+        self.H(qubit)
+        
+    def Rd(self, qubit: int) -> None:
+        """R^(dagger) gate: X <-> Z"""
+        self.H(qubit)
+        
+    def CNOT(self, control: int, target: int) -> None:
+        """CNOT gate"""
+        self._x[target] ^= self._x[control]
+        self._z[control] ^= self._z[target]
+        
+    def MSd(self, qubitA: int, qubitB: int) -> None:
+        """Molmer-Sorensen gate: -pi/2 XX rotation
+        
+        Frames anticommuting with XX are multiplied by XX.
+        """
+        flip = self._z[qubitA] ^ self._z[qubitB]
+        self._x[qubitA] ^= flip
+        self._x[qubitB] ^= flip
@@ -1,9 +1,13 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/05a_sim.mixin.ipynb.
 
 # %% auto 0
-__all__ = ['CircuitRunnerMixin']
+__all__ = ['CircuitRunnerMixin', 'BatchedRunnerMixin']
 
 # %% ../../nbs/05a_sim.mixin.ipynb 3
+import pickle
+import numpy as np
+
+# %% ../../nbs/05a_sim.mixin.ipynb 4
 class CircuitRunnerMixin:
     """Simulator mixin for running quantum circuits"""
         
@@ -27,7 +31,102 @@ class CircuitRunnerMixin:
         args = (qubits,) if type(qubits)==int else qubits
         return gate(*args)
     
-    def run(self, circuit, fault_circuit=None):
+    def reset(self) -> None:
+        """Reset the state to |0...0> such that the simulator can be reused for the next shot
+        
+        Defaults to re-initialization. Simulators for which this is expensive
+        override this method with an in-place reset.
+        """
+        self.__init__(self._n)
+    
+    def _apply_fault(self, gate_symbol, qubits) -> None:
+        """Apply a fault gate of a fault circuit to the `qubits` of the current state
+        
+        Defaults to `_apply_gate`. Simulators which do not represent faults as
+        ordinary gates (e.g. Pauli frames) override this method.
+        
+        Parameters
+        ----------
+        gate_symbol : str
+            The fault gate to apply
+        qubits : int or tuple
+            The qubit(s) to which the fault is applied
+        """
+        self._apply_gate(gate_symbol, qubits)
+    
+    def snapshot(self):
+        """Copy of the current state which can be passed to `restore`"""
+        raise NotImplementedError
+        
+    def restore(self, snapshot) -> None:
+        """Overwrite the current state with `snapshot` (see `snapshot`)"""
+        raise NotImplementedError
+        
+    def state_key(self) -> bytes:
+        """Hashable key of the current state, equal for equal states
+        
+        Defaults to the pickled `snapshot`, which can differ for equal states.
+        Simulators with a canonical form of their state override this method.
+        """
+        return pickle.dumps(self.snapshot())
+    
+    defer_measurements = False # see `run`
+    
+    def measure_joint(self, qubits: list) -> tuple:
+        """Measure `qubits` at once
+        
+        Defaults to measuring one qubit after another. Simulators which can
+        sample all outcomes from the joint distribution override this method.
+        
+        Parameters
+        ----------
+        qubits : list
+            Qubits to measure
+            
+        Returns
+        -------
+        tuple
+            (list of measurement results (0 or 1), True if all results were deterministic)
+        """
+        results = [self.measure(qubit) for qubit in qubits]
+        return [int(res.value) for res in results], all(getattr(res, 'determined', False) for res in results)
+    
+    def _deferred(self, circuit, faults: dict) -> set:
+        """Measurements of `circuit` which are deferred to the end of `run`
+        
+        Terminal measurements (see `Circuit.terminal_measurements`) if
+        `self.defer_measurements`, except those with faults on the measured
+        qubit after the measurement.
+        """
+        if not self.defer_measurements:
+            return set()
+        last_fault = {}
+        for tick_index, tick in faults.items():
+            for _, qubit in tick:
+                last_fault[qubit] = max(tick_index, last_fault.get(qubit, -1))
+        return {(tick_index, qubit) for tick_index, qubit in circuit.terminal_measurements 
+                if last_fault.get(qubit, -1) <= tick_index}
+    
+    @staticmethod
+    def _fault_ticks(fault_circuit) -> dict:
+        """Faults of the ticks with faults as {tick: [(fault gate, qubit), ...]}
+        
+        Parameters
+        ----------
+        fault_circuit : Circuit, list or None
+            Circuit of faults, or list of (tick, qubit, fault gate) (see `ErrorModel.faults`)
+        """
+        faults = {}
+        if isinstance(fault_circuit, list):
+            for tick_index, qubit, gate in fault_circuit:
+                faults.setdefault(tick_index, []).append((gate, qubit))
+        elif fault_circuit:
+            for tick_index, tick in enumerate(fault_circuit):
+                if tick:
+                    faults[tick_index] = [(gate, qubit) for gate, qubits in tick.items() for qubit in qubits]
+        return faults
+    
+    def run(self, circuit, fault_circuit=None, start_tick=0, stop_tick=None):
         """Apply gates in `circuit` sequentially to current state.
         If `fault_circuit` is specified apply fault gates at end of each tick
         
@@ -39,38 +138,188 @@ class CircuitRunnerMixin:
         ----------
         circuit : Circuit
             The circuit to simulate
-        fault_circuit : Circuit or None
-            Circuit of faults to iterate in parallel. Faults are applied *after*
-            gates in `circuit`, only for `measure` gates fault is applied before
+        fault_circuit : Circuit, list or None
+            Circuit of faults to iterate in parallel, or list of (tick, qubit, fault gate)
+            (see `ErrorModel.faults`). Faults are applied *after* gates in `circuit`,
+            only for `measure` gates fault is applied before
+        start_tick : int
+            First tick to simulate (current state is assumed to be the state before this tick)
+        stop_tick : int or None
+            Simulate up to (excluding) this tick (None: until end of circuit)
             
         Returns
         -------
         str or None
             Measurement results as bitstring (None if no measurements were made)
+            
+        Notes
+        -----
+        After the run `self.deterministic` tells if all measurement results,
+        including those of the measurements by which `init` resets qubits,
+        were deterministic (known only for simulators whose measurement results
+        have a `determined` attribute, else False)
+        
+        If `self.defer_measurements`, measurements after which their qubit is
+        not used anymore are made together at the end of the run (see
+        `measure_joint`), the order of the results is unchanged.
         """
         
-        msmt_res = []
-        for tick_index in range(circuit.n_ticks):
+        symbols, ticks = circuit.program # compiled once per circuit
+        methods = [getattr(self, gate) for gate in symbols] # resolve opcodes once per run
+        faults = self._fault_ticks(fault_circuit)
+        deferred = self._deferred(circuit, faults)
+        
+        msmt_res, deferred_qubits = [], []
+        self.deterministic = True
+        stop_tick = circuit.n_ticks if stop_tick is None else stop_tick
+        for tick_index in range(start_tick, stop_tick):
             
-            msmts = []
+            gates, msmts = ticks[tick_index] # measure gates are stored separately, not executed right away.
             
-            for gate, qubits in circuit[tick_index].items():
-                for qubit in sorted(qubits):
-                    if 'measure' in gate:
-                        msmts.append( (gate,qubit) ) # store measure gate, do not execute right away.
-                        continue
-                    res = self._apply_gate(gate, qubit) # execute gates in tick of circuit
+            for opcode, args in gates:
+                methods[opcode](*args) # execute gates in tick of circuit
                         
-            if fault_circuit:
-                for f_gate, f_qubits in fault_circuit[tick_index].items():
-                    for f_qubit in f_qubits:
-                        self._apply_gate(f_gate, f_qubit) # execute gates in tick of fault circuit
+            if tick_index in faults:
+                for f_gate, f_qubit in faults[tick_index]:
+                    self._apply_fault(f_gate, f_qubit) # execute gates in tick of fault circuit
                     
-            for gate, qubit in msmts: # exec stored measurement at end of tick.
-                res = self._apply_gate(gate, qubit) # Execute measuremnt
+            for opcode, args in msmts: # exec stored measurement at end of tick.
+                if (tick_index, *args) in deferred:
+                    deferred_qubits.append(*args)
+                    msmt_res.append(None) # placeholder, measured at end of run
+                    continue
+                res = methods[opcode](*args) # Execute measuremnt
                 msmt_res.append( int(res.value) ) # Append measurement result to list in order of occurence in tick.
+                self.deterministic &= getattr(res, 'determined', False)
+                
+        if deferred_qubits:
+            values, determined = self.measure_joint(deferred_qubits)
+            values = iter(values)
+            msmt_res = [next(values) if res is None else res for res in msmt_res]
+            self.deterministic &= determined
 
         if msmt_res: 
             return ''.join(map(str, msmt_res))
         else: 
             return None # no measurement
+    
+    def run_branches(self, run, circuit, fault_circuit=None):
+        """Apply `circuit` and `fault_circuit` to the current state once for
+        each combination of outcomes of the random measurements
+        
+        Defaults to a single run, which only covers all branches if all its
+        measurements were deterministic. Simulators which can fix the outcomes
+        of random measurements override this method.
+        
+        Parameters
+        ----------
+        run : callable
+            Method used to run `circuit` (`self.run` or a wrapper of it, e.g. `QubitMap.run`)
+        circuit : Circuit
+            The circuit to simulate
+        fault_circuit : Circuit, list or None
+            Faults to apply (see `run`)
+            
+        Returns
+        -------
+        list or None
+            (probability, measurement results as bitstring, snapshot of the final state)
+            per branch, None if the branches could not be enumerated
+        """
+        msmt = run(circuit, fault_circuit)
+        return [(1.0, msmt, self.snapshot())] if self.deterministic else None
+    
+    def run_checkpointed(self, circuit, fault_circuit=None, checkpoints=None):
+        """Apply `circuit` and `fault_circuit` to the state |0...0> (e.g. right
+        after `reset`), skipping the noiseless prefix of the circuit.
+        
+        The prefix consists of all ticks before the first tick with faults or
+        measurements. If its simulation involved no random collapses (e.g. by
+        an `init` of an entangled qubit), its final state is the same in every
+        shot. It is then stored in `checkpoints` and restored in later calls.
+        
+        Parameters
+        ----------
+        circuit : Circuit
+            The circuit to simulate
+        fault_circuit : Circuit, list or None
+            Faults to apply (see `run`)
+        checkpoints : dict
+            Cache of snapshots after the noiseless prefixes, keys: (`Circuit.digest`, tick)
+            
+        Returns
+        -------
+        str or None
+            Measurement results as bitstring (None if no measurements were made)
+        """
+        start_tick = 0
+        stop_tick = min(self._fault_ticks(fault_circuit), default=circuit.n_ticks)
+        while start_tick < stop_tick and not circuit.program[1][start_tick][1]: # no measurements
+            start_tick += 1
+        
+        if start_tick == 0:
+            return self.run(circuit, fault_circuit)
+        
+        key = (circuit.digest, start_tick)
+        deterministic = True
+        if key in checkpoints:
+            self.restore(checkpoints[key])
+        else:
+            self.run(circuit, stop_tick=start_tick)
+            deterministic = self.deterministic
+            if deterministic:
+                checkpoints[key] = self.snapshot()
+        msmt = self.run(circuit, fault_circuit, start_tick=start_tick)
+        self.deterministic &= deterministic
+        return msmt
+
+# %% ../../nbs/05a_sim.mixin.ipynb 5
+class BatchedRunnerMixin(CircuitRunnerMixin):
+    """Simulator mixin for running a quantum circuit on a block of shots at once
+    
+    The simulator holds the states of all shots and implements `pauli(pauli, qubit, shots)`,
+    its gates act on all shots and its `measure` returns the outcomes of all shots as array.
+    """
+    
+    def run(self, circuit, fault_circuits=None):
+        """Apply gates in `circuit` to all shots, and faults in `fault_circuits[i]`
+        to shot i at the end of each tick (see `CircuitRunnerMixin.run`).
+        
+        Parameters
+        ----------
+        circuit : Circuit
+            The circuit to simulate
+        fault_circuits : list of Circuit or None
+            One fault circuit, fault list (see `ErrorModel.faults`) or None per shot.
+            Only Pauli faults are supported.
+            
+        Returns
+        -------
+        list of str or None
+            Measurement results of each shot as bitstring (None if no measurements were made)
+        """
+        faults = [{} for _ in range(circuit.n_ticks)] # per tick: (gate, qubit) -> shots
+        for shot, fault_circuit in enumerate(fault_circuits or []):
+            for tick_index, tick in self._fault_ticks(fault_circuit).items():
+                for f_gate, f_qubit in tick:
+                    faults[tick_index].setdefault((f_gate, f_qubit), []).append(shot)
+                        
+        symbols, ticks = circuit.program
+        methods = [getattr(self, gate) for gate in symbols]
+        
+        msmt_res = []
+        for tick_index, (gates, msmts) in enumerate(ticks):
+            
+            for opcode, args in gates:
+                methods[opcode](*args)
+                    
+            for (f_gate, f_qubit), shots in faults[tick_index].items():
+                self.pauli(f_gate, f_qubit, shots)
+                    
+            for opcode, args in msmts:
+                msmt_res.append( methods[opcode](*args) )
+
+        if msmt_res:
+            return [''.join(map(str, shot)) for shot in np.array(msmt_res, dtype=int).T]
+        else:
+            return None
@@ -0,0 +1,507 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/05e_sim.numpy_statevector.ipynb.
+
+# %% auto 0
+__all__ = ['GATES1', 'GATES2', 'PAULIS', 'ROTATIONS', 'gate_matrix', 'fuse_gates', 'NumpyStatevectorSimulator',
+           'BatchedNumpyStatevectorSimulator']
+
+# %% ../../nbs/05e_sim.numpy_statevector.ipynb 3
+from .mixin import CircuitRunnerMixin, BatchedRunnerMixin
+from .stabilizer import MeasureResult
+
+import numpy as np
+
+# %% ../../nbs/05e_sim.numpy_statevector.ipynb 4
+_S = np.diag([1, 1j])
+_Q = np.array([[1 + 1j, 1 - 1j], [1 - 1j, 1 + 1j]]) / 2 # sqrt(X)
+_R = _S @ _Q @ _S.conj().T # sqrt(XZ) = S Q S^(dagger)
+_CNOT = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+
+GATES1 = {
+    "X": np.array([[0, 1], [1, 0]], dtype=complex),
+    "Y": np.array([[0, -1j], [1j, 0]]),
+    "Z": np.diag([1, -1]).astype(complex),
+    "H": np.array([[1, 1], [1, -1]]) / np.sqrt(2),
+    "S": _S,
+    "Sd": _S.conj().T,
+    "T": np.diag([1, np.exp(1j * np.pi / 4)]),
+    "Td": np.diag([1, np.exp(-1j * np.pi / 4)]),
+    "Q": _Q,
+    "Qd": _Q.conj().T,
+    "R": _R,
+    "Rd": _R.conj().T,
+}
+
+GATES2 = {
+    "CNOT": _CNOT.astype(complex),
+    # Rd(a), CNOT(a,b), R(a), Qd(a), Qd(b) as in `StabilizerSimulator.MSd`
+    "MSd": np.kron(GATES1["Qd"], GATES1["Qd"]) @ np.kron(_R, np.eye(2)) @ _CNOT @ np.kron(_R.conj().T, np.eye(2)),
+}
+
+PAULIS = {"X", "Y", "Z"}
+
+ROTATIONS = {
+    "Rx": lambda angle: np.array([[np.cos(angle / 2), -1j * np.sin(angle / 2)], [-1j * np.sin(angle / 2), np.cos(angle / 2)]]),
+    "Ry": lambda angle: np.array([[np.cos(angle / 2), -np.sin(angle / 2)], [np.sin(angle / 2), np.cos(angle / 2)]]),
+    "Rz": lambda angle: np.diag([np.exp(-0.5j * angle), np.exp(0.5j * angle)]),
+}
+
+# %% ../../nbs/05e_sim.numpy_statevector.ipynb 5
+def gate_matrix(symbol: str, args: tuple):
+    """Unitary of gate `symbol` applied with arguments `args` (None if not unitary, e.g. `init`)"""
+    if symbol in GATES1: return GATES1[symbol]
+    if symbol in GATES2: return GATES2[symbol]
+    if symbol in ROTATIONS: return ROTATIONS[symbol](args[1])
+    return None
+
+def fuse_gates(gates) -> list:
+    """Fuse a sequence of gates into fewer unitaries
+    
+    Consecutive single-qubit gates on the same qubit are multiplied into one
+    2x2 matrix, single-qubit gates before and after a two-qubit gate and
+    consecutive two-qubit gates on the same pair of qubits are absorbed into
+    one 4x4 matrix. Gates without matrix (see `gate_matrix`) are kept as
+    barriers on their qubits.
+    
+    Parameters
+    ----------
+    gates : iterable
+        (gate symbol, arguments) in order of execution
+        
+    Returns
+    -------
+    list
+        (gate, qubits) in order of execution, where gate is either the
+        symbol of an unfused gate (qubits are its arguments) or a 2x2 or
+        4x4 matrix (qubits are the one or two qubits it acts on)
+    """
+    fused = [] # [gate, qubits, number of fused gates]
+    last = {} # qubit -> index in fused of last op on qubit
+    pending = {} # qubit -> single-qubit op not yet placed in fused
+    
+    def place(op):
+        for q in op[1]: last[q] = len(fused)
+        fused.append(op)
+        
+    for symbol, args in gates:
+        U = gate_matrix(symbol, args)
+        if U is None:
+            for q in args:
+                if q in pending: place(pending.pop(q))
+            place([symbol, args, 1])
+        elif len(U) == 2:
+            q = args[0]
+            prev = fused[last[q]] if q in last else None
+            if q in pending:
+                op = pending[q]
+                op[0], op[2] = U @ op[0], op[2] + 1
+            elif prev is not None and len(prev[1]) == 2 and not isinstance(prev[0], str):
+                prev[0] = (np.kron(U, np.eye(2)) if prev[1][0] == q else np.kron(np.eye(2), U)) @ prev[0]
+                prev[2] += 1
+            else:
+                pending[q] = [U, (q,), 1, (symbol, args)]
+        else:
+            a, b = args
+            ops = [pending.pop(q, None) for q in args]
+            U = U @ np.kron(*[np.eye(2) if op is None else op[0] for op in ops])
+            n_fused = 1 + sum(op[2] for op in ops if op)
+            prev = fused[last[a]] if a in last else None
+            if prev is not None and last.get(b) == last[a] and not isinstance(prev[0], str):
+                if prev[1] != (a, b): # same pair, reversed order
+                    swap = np.eye(4)[[0, 2, 1, 3]]
+                    U = swap @ U @ swap
+                prev[0], prev[2] = U @ prev[0], prev[2] + n_fused
+            else:
+                place([U, (a, b), n_fused, (symbol, args)])
+    for op in pending.values():
+        place(op)
+    return [(op[3][0], op[3][1]) if op[2] == 1 and len(op) == 4 else (op[0], op[1]) for op in fused]
+
+# %% ../../nbs/05e_sim.numpy_statevector.ipynb 6
+class NumpyStatevectorSimulator(CircuitRunnerMixin):
+    """Statevector simulator on a NumPy array
+    
+    Same interface as `StatevectorSimulator`, without the ProjectQ engine.
+    The state of n qubits is a complex array of shape (2,)*n, axis i is qubit
+    i. Gates update the two (four) slices of the array belonging to the values
+    of their qubit(s) in-place, measurements sample from the marginal
+    probability of the measured qubit and project the state.
+    
+    Attributes
+    ----------
+    _n : int
+        Number of qubits to simulate
+    _psi : np.array
+        Amplitudes, shape (2,)*n
+    _fusions : dict
+        Fused gates of circuit segments, keys: (circuit digest, first tick, last tick + 1)
+    """
+    
+    def __init__(self, num_qubits):
+        """
+        Parameters
+        ----------
+        num_qubits : int
+            Number of qubits to simualate
+        """
+        self._n = num_qubits
+        self._psi = np.zeros((2,) * num_qubits, dtype=complex)
+        self._fusions = {} # kept by `reset`, i.e. for all shots of a sampling run
+        self.reset()
+        
+    def reset(self) -> None:
+        """Reset all qubits to |0>"""
+        self._psi[...] = 0
+        self._psi[(..., *(0,) * self._n)] = 1
+        
+    def snapshot(self) -> np.ndarray:
+        """Copy of the amplitudes"""
+        return self._psi.copy()
+    
+    def restore(self, snapshot: np.ndarray) -> None:
+        """Overwrite the amplitudes with `snapshot`"""
+        self._psi[...] = snapshot
+        
+    def _slice(self, *qubit_values) -> np.ndarray:
+        """View of the amplitudes with qubits fixed to values, e.g. `_slice((0, 1), (2, 0))`"""
+        index = [slice(None)] * self._n
+        for qubit, value in qubit_values:
+            index[qubit] = value
+        return self._psi[(..., *index)] # ellipsis: view even if all qubits fixed, leading (batch) axes kept
+        
+    def _apply1(self, U: np.ndarray, qubit: int) -> None:
+        """Apply single-qubit unitary `U` to `qubit`"""
+        a0, a1 = self._slice((qubit, 0)), self._slice((qubit, 1))
+        if U[0, 1] == 0 and U[1, 0] == 0: # diagonal (e.g. fused phase gates)
+            if U[0, 0] != 1: a0 *= U[0, 0]
+            a1 *= U[1, 1]
+            return
+        b0 = U[0, 0] * a0 + U[0, 1] * a1
+        a1[...] = U[1, 0] * a0 + U[1, 1] * a1
+        a0[...] = b0
+        
+    def _apply2(self, U: np.ndarray, qubitA: int, qubitB: int) -> None:
+        """Apply two-qubit unitary `U` to (`qubitA`, `qubitB`), `qubitA` is the more significant one"""
+        a = [self._slice((qubitA, i >> 1), (qubitB, i & 1)) for i in range(4)]
+        b = U @ np.stack(a).reshape(4, -1) # one matrix product instead of 16 scaled additions
+        for ai, bi in zip(a, b):
+            ai[...] = bi.reshape(ai.shape)
+            
+    def _probability(self, qubit: int) -> float:
+        """Probability to measure 1 on `qubit` (for each index of leading axes)"""
+        p1 = np.abs(self._slice((qubit, 1)))**2
+        return p1.sum(axis=tuple(range(p1.ndim - self._n + 1, p1.ndim)))
+        
+    def _fused(self, circuit, start_tick: int, stop_tick: int) -> list:
+        """Fused gates of ticks `start_tick` to `stop_tick` - 1 of `circuit` (see `fuse_gates`)"""
+        key = (circuit.digest, start_tick, stop_tick)
+        if key not in self._fusions:
+            symbols, ticks = circuit.program
+            self._fusions[key] = fuse_gates((symbols[opcode], args) for gates, _ in ticks[start_tick:stop_tick] 
+                                            for opcode, args in gates)
+        return self._fusions[key]
+    
+    def run(self, circuit, fault_circuit=None, start_tick=0, stop_tick=None):
+        """Apply gates in `circuit` and faults in `fault_circuit` to the current state
+        
+        Same as `CircuitRunnerMixin.run`, but the gates of all ticks up to the
+        next tick with faults or measurements are fused (see `fuse_gates`) and
+        applied at once. Faults and measurements stay at the end of their tick,
+        Pauli faults of a tick are applied together (see `paulis`). Terminal
+        measurements are deferred to the end of the run (see `measure_joint`).
+        """
+        symbols, ticks = circuit.program
+        faults = self._fault_ticks(fault_circuit)
+        deferred = self._deferred(circuit, faults)
+        
+        msmt_res, deferred_qubits = [], []
+        self.deterministic = True
+        stop_tick = circuit.n_ticks if stop_tick is None else stop_tick
+        segment_start = start_tick
+        for tick_index in range(start_tick, stop_tick):
+            
+            msmts = ticks[tick_index][1]
+            if all((tick_index, *args) in deferred for _, args in msmts) and \
+               not (tick_index in faults or tick_index == stop_tick - 1):
+                deferred_qubits.extend(args[0] for _, args in msmts) # no need to end the fused segment
+                msmt_res.extend([None] * len(msmts))
+                continue
+            
+            for gate, qubits in self._fused(circuit, segment_start, tick_index + 1):
+                if isinstance(gate, str):
+                    getattr(self, gate)(*qubits)
+                elif len(qubits) == 1:
+                    self._apply1(gate, *qubits)
+                else:
+                    self._apply2(gate, *qubits)
+            segment_start = tick_index + 1
+            
+            if len(faults.get(tick_index, [])) > 1 and all(f_gate in PAULIS for f_gate, _ in faults[tick_index]):
+                self.paulis(faults[tick_index]) # all faults of tick in one pass
+            elif tick_index in faults:
+                for f_gate, f_qubit in faults[tick_index]:
+                    self._apply_fault(f_gate, f_qubit)
+                    
+            for opcode, args in msmts:
+                if (tick_index, *args) in deferred:
+                    deferred_qubits.append(*args)
+                    msmt_res.append(None) # placeholder, measured at end of run
+                    continue
+                res = getattr(self, symbols[opcode])(*args)
+                msmt_res.append( int(res.value) )
+                self.deterministic &= res.determined
+                
+        if deferred_qubits:
+            values, determined = self.measure_joint(deferred_qubits)
+            values = iter(values)
+            msmt_res = [next(values) if res is None else res for res in msmt_res]
+            self.deterministic &= determined
+
+        if msmt_res: 
+            return ''.join(map(str, msmt_res))
+        else: 
+            return None
+        
+    defer_measurements = True
+    
+    def measure_joint(self, qubits: list) -> tuple:
+        """Measure `qubits` at once by sampling from their joint distribution
+        
+        Parameters
+        ----------
+        qubits : list
+            Qubits to measure
+            
+        Returns
+        -------
+        tuple
+            (list of measurement results (0 or 1), True if the outcome was deterministic)
+        """
+        joint = np.sum(np.abs(self._psi)**2, axis=tuple(q for q in range(self._n) if q not in qubits))
+        joint = np.transpose(joint, np.argsort(np.argsort(qubits))) # axes in order of `qubits`
+        p = joint.ravel()
+        index = min(np.searchsorted(np.cumsum(p), np.random.random() * p.sum(), side='right'), len(p) - 1)
+        values = np.unravel_index(index, joint.shape)
+        
+        kept = self._slice(*zip(qubits, values)) / np.sqrt(p[index])
+        self._psi[...] = 0
+        self._slice(*zip(qubits, values))[...] = kept
+        return [int(v) for v in values], p[index] > 1 - 1e-12
+    
+    def paulis(self, paulis) -> None:
+        """Apply a product of Pauli gates in one pass over the amplitudes
+        
+        The product is collected as i^k X^x Z^z and applied as a permutation
+        of the amplitudes (flip of the axes of the qubits in x) times a phase
+        which only depends on the qubits in z.
+        
+        Parameters
+        ----------
+        paulis : list
+            (Pauli, qubit) in order of application, Pauli one of 'X', 'Y' or 'Z'
+        """
+        x, z, k = set(), set(), 0
+        for pauli, qubit in paulis:
+            if pauli != "X": # Z X^x = (-1)^x X^x Z, Y = iXZ
+                k += 2 * (qubit in x) + (pauli == "Y")
+                z ^= {qubit}
+            if pauli != "Z":
+                x ^= {qubit}
+                
+        if not x: # sign flips of halves are cheaper than a full pass
+            for q in z: self.Z(q)
+            if k % 4: self._psi *= 1j**k
+            return
+        
+        phase = np.full((1,) * self._n, 1j**k)
+        for q in z:
+            sign = np.array([-1, 1] if q in x else [1, -1]).reshape((1,) * q + (2,) + (1,) * (self._n - q - 1))
+            phase = phase * sign
+        psi = np.flip(self._psi, axis=[q - self._n for q in x])
+        self._psi[...] = psi * phase if z or k % 4 else psi
+        
+    def init(self, qubit: int) -> None:
+        """Initialize to |0>
+        
+        Clears `deterministic` if the state of `qubit` was random (see `CircuitRunnerMixin.run`).
+        """
+        res = self.measure(qubit)
+        if not res.determined:
+            self.deterministic = False
+        if res.value:
+            self.X(qubit)
+    
+    def measure(self, qubit: int) -> MeasureResult:
+        """Measurement in Z basis"""
+        p1 = float(self._probability(qubit))
+        value = np.random.random() < p1
+        self._slice((qubit, 1 - value))[...] = 0
+        self._psi /= np.sqrt(p1 if value else 1 - p1)
+        return MeasureResult(value=value, determined=min(p1, 1 - p1) < 1e-12)
+    
+    def expectation(self, qubit: int) -> float:
+        """Expectation value of measuring `qubit`
+        
+        Parameters
+        ----------
+        qubit : int
+            Qubit of which expectation value is determined
+        
+        Returns
+        -------
+        float
+            Expectation value of `qubit`
+        """
+        return 1 - 2 * self._probability(qubit)
+        
+    def I(self, qubit: int) -> None:
+        """Identity gate"""
+        pass
+    
+    def X(self, qubit: int) -> None:
+        """X gate"""
+        a0, a1 = self._slice((qubit, 0)), self._slice((qubit, 1))
+        a0[...], a1[...] = a1.copy(), a0.copy()
+        
+    def Y(self, qubit: int) -> None:
+        """Y gate"""
+        a0, a1 = self._slice((qubit, 0)), self._slice((qubit, 1))
+        a0[...], a1[...] = -1j * a1, 1j * a0
+        
+    def Z(self, qubit: int) -> None:
+        """Z gate"""
+        self._slice((qubit, 1))[...] *= -1
+        
+    def H(self, qubit: int) -> None:
+        """H gate"""
+        self._apply1(GATES1["H"], qubit)
+        
+    def CNOT(self, control: int, target: int) -> None:
+        """CNOT gate"""
+        a0, a1 = self._slice((control, 1), (target, 0)), self._slice((control, 1), (target, 1))
+        a0[...], a1[...] = a1.copy(), a0.copy()
+        
+    def T(self, qubit: int) -> None:
+        """T gate"""
+        self._slice((qubit, 1))[...] *= GATES1["T"][1, 1]
+        
+    def Td(self, qubit: int) -> None:
+        """T^(dagger) gate"""
+        self._slice((qubit, 1))[...] *= GATES1["Td"][1, 1]
+        
+    def S(self, qubit: int) -> None:
+        """Phase gate"""
+        self._slice((qubit, 1))[...] *= 1j
+        
+    def Sd(self, qubit: int) -> None:
+        """S^(dagger) gate"""
+        self._slice((qubit, 1))[...] *= -1j
+        
+    def Q(self, qubit: int) -> None:
+        """Q = sqrt(X) gate"""
+        self._apply1(GATES1["Q"], qubit)
+        
+    def Qd(self, qubit: int) -> None:
+        """Q^(dagger) gate"""
+        self._apply1(GATES1["Qd"], qubit)
+    
+    def Rx(self, qubit: int, angle: float) -> None:
+        """X-rotation gate"""
+        self._apply1(ROTATIONS["Rx"](angle), qubit)
+        
+    def Ry(self, qubit: int, angle: float) -> None:
+        """Y-rotation gate"""
+        self._apply1(ROTATIONS["Ry"](angle), qubit)
+   
+    def Rz(self, qubit: int, angle: float) -> None:
+        """Z-rotation gate"""
+        self._apply1(ROTATIONS["Rz"](angle), qubit)
+        
+    def R(self, qubit: int) -> None:
+        """R = sqrt(XZ) gate"""
+        self._apply1(GATES1["R"], qubit)
+        
+    def Rd(self, qubit: int) -> None:
+        """R^(dagger) gate"""
+        self._apply1(GATES1["Rd"], qubit)
+        
+    def MSd(self, qubitA: int, qubitB: int) -> None:
+        """Molmer-Sorensen gate: -pi/2 XX rotation
+        
+        Reference
+        ---------
+            https://arxiv.org/pdf/2111.12654.pdf
+        """
+        self._apply2(GATES2["MSd"], qubitA, qubitB)
+
+# %% ../../nbs/05e_sim.numpy_statevector.ipynb 7
+class BatchedNumpyStatevectorSimulator(BatchedRunnerMixin, NumpyStatevectorSimulator):
+    """`NumpyStatevectorSimulator` which simulates a block of shots at once
+    
+    The amplitudes of all B shots are held in one (B, 2**n) array, viewed as
+    shape (B,)+(2,)*n. Each gate of a circuit is applied to all shots in one
+    vectorized operation, per-shot Pauli faults are applied as masked
+    permutations and sign flips of the amplitudes. Measurements sample and
+    project each shot independently.
+    
+    Attributes
+    ----------
+    _b : int
+        Number of shots (batch size)
+    """
+    
+    def __init__(self, num_qubits, batch_size):
+        """
+        Parameters
+        ----------
+        num_qubits : int
+            Number of qubits to simualate
+        batch_size : int
+            Number of shots
+        """
+        self._n = num_qubits
+        self._b = batch_size
+        self._psi = np.zeros((batch_size, 2**num_qubits), dtype=complex).reshape((batch_size,) + (2,) * num_qubits)
+        self.reset()
+        
+    def pauli(self, pauli: str, qubit: int, shots=slice(None)) -> None:
+        """Apply a Pauli gate to `qubit` of the selected shots
+        
+        Parameters
+        ----------
+        pauli : str
+            One of 'X', 'Y' or 'Z'
+        qubit : int
+            Qubit to apply the Pauli gate to
+        shots : slice or array
+            Indices or mask of the shots to which the gate is applied
+        """
+        psi = self._psi[shots]
+        index = (slice(None),) * (qubit + 1) # shots and preceding qubits
+        a0, a1 = psi[(*index, 0, ...)], psi[(*index, 1, ...)]
+        if pauli == "X":
+            a0[...], a1[...] = a1.copy(), a0.copy()
+        elif pauli == "Y":
+            a0[...], a1[...] = -1j * a1, 1j * a0
+        else:
+            a1 *= -1
+        self._psi[shots] = psi
+        
+    def init(self, qubit: int) -> None:
+        """Initialize to |0>"""
+        self.pauli("X", qubit, self.measure(qubit))
+        
+    def measure(self, qubit: int) -> np.ndarray:
+        """Measurement in Z basis of all shots
+        
+        Returns
+        -------
+        np.array
+            Boolean array of the measurement outcomes of all shots
+        """
+        p1 = self._probability(qubit)
+        values = np.random.random(self._b) < p1
+        self._slice((qubit, 0))[values] = 0
+        self._slice((qubit, 1))[~values] = 0
+        norm = np.sqrt(np.where(values, p1, 1 - p1))
+        self._psi /= norm.reshape((-1,) + (1,) * self._n)
+        return values
@@ -6,6 +6,7 @@ __all__ = ['MeasureResult', 'StatevectorSimulator']
 # %% ../../nbs/05c_sim.statevector.ipynb 3
 from .mixin import CircuitRunnerMixin
 from projectq import MainEngine
+import numpy as np
 import projectq.ops as ops
 
 # %% ../../nbs/05c_sim.statevector.ipynb 4
@@ -51,9 +52,36 @@ class StatevectorSimulator(CircuitRunnerMixin):
         self.qureg = self.eng.allocate_qureg(num_qubits)
         self.qubits = {i:qb for i,qb in enumerate(self.qureg)}
         
+    def reset(self) -> None:
+        """Reset all qubits to |0> (reuses engine and quantum register)"""
+        self.eng.flush()
+        ops.All(ops.Measure) | self.qureg
+        self.eng.flush()
+        for q in self.qureg:
+            if int(q):
+                ops.X | q
+        
+    def snapshot(self) -> tuple:
+        """Copy of the wavefunction (with the order of the qubits in it)"""
+        self.eng.flush()
+        mapping, wavefunction = self.eng.backend.cheat()
+        order = sorted(range(self._n), key=lambda i: mapping[self.qureg[i].id])
+        return order, list(wavefunction)
+    
+    def restore(self, snapshot: tuple) -> None:
+        """Overwrite the wavefunction with `snapshot`"""
+        order, wavefunction = snapshot
+        self.eng.flush()
+        self.eng.backend.set_wavefunction(wavefunction, [self.qureg[i] for i in order])
+        
     def init(self, qubit: int) -> None:
-        """Initialize to |0>"""
+        """Initialize to |0>
+        
+        Clears `deterministic`: measurements of ProjectQ do not tell if their
+        outcome was random (see `CircuitRunnerMixin.run`).
+        """
         outcome = self.measure(qubit)
+        self.deterministic = False
         if outcome.value == 1:
             self.X(qubit)
     
@@ -65,6 +93,34 @@ class StatevectorSimulator(CircuitRunnerMixin):
         self.eng.flush()
         return MeasureResult(value=int(q)) 
     
+    defer_measurements = True
+        
+    def measure_joint(self, qubits: list) -> tuple:
+        """Measure `qubits` at once by sampling from the wavefunction (one flush
+        instead of two per qubit)
+        
+        Parameters
+        ----------
+        qubits : list
+            Qubits to measure
+            
+        Returns
+        -------
+        tuple
+            (list of measurement results (0 or 1), True if the outcome was deterministic)
+        """
+        self.eng.flush()
+        mapping, wavefunction = self.eng.backend.cheat()
+        probs = np.abs(np.array(wavefunction))**2
+        index = np.random.choice(len(probs), p=probs / probs.sum())
+        positions = [mapping[self.qubits[q].id] for q in qubits]
+        values = [(index >> pos) & 1 for pos in positions]
+        
+        indices = np.arange(len(probs))
+        matches = np.all([(indices >> pos) & 1 == v for pos, v in zip(positions, values)], axis=0)
+        self.eng.backend.collapse_wavefunction([self.qubits[q] for q in qubits], values)
+        return values, probs[matches].sum() > 1 - 1e-12
+    
     def expectation(self, qubit: int) -> float:
         """Expectation value of measuring `qubit`
         
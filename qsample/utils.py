@@ -34,6 +34,6 @@ def load(path):
     *
         Loaded data
     """
-    with open(path, 'wb') as fp:
+    with open(path, 'rb') as fp:
         data = pickle.load(fp)
     return data